@@ -1,13 +1,26 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import atexit
+import ctypes
 import curses
+import errno
+import functools
+import hashlib
 import logging
+import mmap
 import os
 import re
+import shlex
+import shutil
 import subprocess
 import sys
+import tempfile
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import PurePosixPath
 from textwrap import wrap
 
 # --- Configuration ---
@@ -19,11 +32,168 @@ APP_DESCRIPTION = "Professional Disk Imaging Tool"
 BS = "64K"
 # Options for dd command
 DD_OPTS = f"conv=sync,noerror bs={BS}"
+# Options for dd when it writes straight to a block device: bypass the page cache
+# instead of double-buffering the whole image in RAM (get_block_size_choice only
+# offers multiples of the device's logical sector size, as O_DIRECT requires)
+DD_DEVICE_WRITE_OPTS = "oflag=direct"
+# Options for dd in the network pipelines: large blocks, full reads from pipes
+DD_NET_OPTS = "bs=4M iflag=fullblock"
+# Extra options when a network pipeline's dd writes straight to a block device
+DD_NET_DEVICE_OPTS = "oflag=direct conv=fsync"
+# Extra options when a network backup's dd reads the source block device; a
+# single sequential pass gains nothing from the page cache and would evict it.
+# noerror,sync keeps going past unreadable sectors (zero-filling the block) so
+# one bad sector doesn't abort a rescue backup
+DD_NET_SOURCE_OPTS = "iflag=direct conv=noerror,sync"
 LOG_FILE = "ddi.log"
+# Worker threads for parallel compressors (pigz/zstd/xz) in network pipelines
+PAR_THREADS = os.cpu_count() or 1
+
+def _cpu_has_aes():
+    """Return True if the CPU advertises AES instructions."""
+    try:
+        with open('/proc/cpuinfo', 'r') as f:
+            for line in f:
+                # x86 reports 'flags', ARM reports 'Features'
+                if line.startswith(('flags', 'Features')):
+                    return 'aes' in line.split()
+    except OSError:
+        pass
+    return False
+
+CPU_HAS_AES = _cpu_has_aes()
+
+def _detect_ssh_cipher():
+    """Pick AES-GCM when the CPU has AES instructions, else ChaCha20-Poly1305."""
+    return "aes128-gcm@openssh.com" if CPU_HAS_AES else "chacha20-poly1305@openssh.com"
+
+# SSH options for bulk transfers: cheap AEAD cipher, no SSH compression (the
+# stream is compressed upstream) and a shared master connection so transfers
+# reuse the session opened by test_ssh_connection instead of a new handshake.
+# The master outlives the menus and prompts between the test and the transfer.
+# Its socket lives in a private (0700) directory (see get_ssh_control_dir):
+# anyone able to create the socket first would receive every transfer's stream.
+SSH_CONTROL_PERSIST = 600
+SSH_BULK_OPTS = f"-c {_detect_ssh_cipher()} -o Compression=no -o IPQoS=throughput"
+# Accepted SSH usernames and hosts (names, IPv4/IPv6 addresses); a leading
+# '-' would be read by ssh as an option
+SSH_NAME_RE = re.compile(r'[A-Za-z0-9_.][A-Za-z0-9_.:%-]*\Z')
+# Parallel SSH connections for raw (uncompressed) image transfers; one stream
+# is limited by a single sshd core and a single TCP window
+SSH_STREAMS = min(4, PAR_THREADS)
+# Streams read or write far-apart ranges at once, which makes rotational disks
+# seek constantly; they only stripe when this is set
+SSH_STRIPE_ROTATIONAL = False
+# Unit in which raw images are split between the parallel streams
+STRIPE_BLOCK_SIZE = 4 * 1024 * 1024
+
+# Optional in-memory buffer stage for the SSH pipelines; absorbs network and
+# compressor stalls so neither side of the pipe sits idle
+MBUFFER_STAGE = "mbuffer -q -m 256M | " if shutil.which("mbuffer") else ""
+
+# pv lets compressed restores report progress against the compressed file size
+PV_AVAILABLE = shutil.which("pv") is not None
+
+# NFS mount options tuned for one large sequential dd stream
+NFS_MOUNT_OPTS = "nconnect=8,rsize=1048576,wsize=1048576,nocto,actimeo=600,lookupcache=pos,noatime,nodiratime,hard,noresvport,async"
+# Readahead (KiB) applied to the NFS mount's backing device
+NFS_READ_AHEAD_KB = 4096
+
+# Image file extensions listed by the restore pickers
+IMAGE_EXTS = ('.img', '.img.gz', '.img.zst', '.img.xz')
+# Decompressors by extension (gzip is resolved at runtime to prefer unpigz)
+DECOMPRESSION_CMDS = {
+    '.zst': "zstd -d -c --long=27",
+    '.xz': f"xz -d -c -T{PAR_THREADS}",
+}
+
+# Checksum file extensions and the hash each one holds
+CHECKSUM_EXTS_MAP = {".md5": "MD5", ".sha256": "SHA-256"}
+CHECKSUM_EXTS = tuple(CHECKSUM_EXTS_MAP)
+# Read size used when hashing image files
+HASH_CHUNK_SIZE = 4 * 1024 * 1024
+# Bytes moved per splice(2) call when streaming a device into a pipe
+SPLICE_CHUNK_SIZE = 1 << 20
+# This script as a pipeline stage, for the helper modes handled in __main__
+SELF_CMD = f"{shlex.quote(sys.executable)} {shlex.quote(os.path.abspath(__file__))}"
+# Size of the precomputed buffer streamed by pattern-fill wipe passes
+FILL_BUFFER_SIZE = 1 << 20
+# Wipe methods as (menu label, method name, passes), in menu order
+_RANDOM_PASS = ("random", "/dev/urandom")
+# Simplified Gutmann - alternating random and patterns
+_GUTMANN_PATTERNS = ("0x55", "0xAA", "0x92", "0x49", "0x24", "0x00", "0x11", "0x22", "0x33",
+                     "0x44", "0x55", "0x66", "0x77", "0x88", "0x99", "0xAA", "0xBB", "0xCC",
+                     "0xDD", "0xEE", "0xFF", "0x92", "0x49", "0x24", "0x6D", "0xB6", "0xDB")
+WIPE_METHODS = (
+    ("Zero Fill (1 pass) - Fast, good for non-sensitive data",
+     "Zero Fill", (("zero", "0x00"),)),
+    ("Device Zero-Out (1 pass) - Offloaded on SSD/NVMe, zero fill if unsupported",
+     "Device Zero-Out", (("zeroout", "blkdiscard -z"),)),
+    ("Random Data (1 pass) - Fast, better security than zeros",
+     "Random Data (1 pass)", (_RANDOM_PASS,)),
+    ("DoD 5220.22-M (3 passes) - US DoD standard",
+     "DoD 5220.22-M", (_RANDOM_PASS, ("complement", "0xFF"), _RANDOM_PASS)),
+    ("Random Data (7 passes) - High security, slower",
+     "Random Data (7 passes)", (_RANDOM_PASS,) * 7),
+    ("Gutmann (35 passes) - Maximum security, very slow",
+     "Gutmann (35 passes)",
+     (_RANDOM_PASS,) * 4 + tuple(("pattern", p) for p in _GUTMANN_PATTERNS) + (_RANDOM_PASS,) * 4),
+)
+# Main menu entries, in the order main() dispatches them
+MAIN_MENU = (
+    "Backup Disk  - Create disk image to local file or network",
+    "Restore Disk - Restore disk image from local file or network",
+    "Wipe Disk    - Securely erase disk data",
+    "Check Disk   - Display disk health and information",
+    "Exit         - Close DDI application",
+)
+# fstrim lets a backup offer to discard the source's free space so it compresses away
+FSTRIM_AVAILABLE = shutil.which("fstrim") is not None
+# Random wipe passes use an openssl keystream (AES-CTR with AES instructions,
+# else ChaCha20), which is several times faster than reading /dev/urandom
+OPENSSL_AVAILABLE = shutil.which("openssl") is not None
+# Splice helper mode (splice needs Python 3.10+ on Linux)
+SPLICE_COPY_CMD = f"{SELF_CMD} --splice-copy" if hasattr(os, 'splice') else None
+
+# Progress parsing for dd/pv stderr; each progress update arrives as its own line
+# starting with the byte count, so the patterns are anchored with match()
+DD_PROGRESS_RE = re.compile(r"(\d+)\s+bytes")
+# 'pv -n -b' reports a bare byte count per line
+PV_PROGRESS_RE = re.compile(r"\s*(\d+)\s*$")
+DD_ERROR_RE = re.compile(r"(error reading|error writing|Input/output error|Cannot allocate memory)", re.IGNORECASE)
+# Only the tail of stderr is kept for the exit checks, not hours of progress lines
+STDERR_TAIL_LINES = 64
+
+# Mouse wheel masks (BUTTON5_PRESSED is missing from some curses builds)
+MOUSE_SCROLL_UP = curses.BUTTON4_PRESSED
+MOUSE_SCROLL_DOWN = 1 << 21
+
+# FS-Cache availability for NFS restores ('active' is None until checked)
+_fscache_state = {'active': None, 'notified': False}
+
+# Private SSH master socket directory, created on first use by the process
+# that owns it (helper re-execs never create one)
+_ssh_control_state = {'dir': None, 'pid': None}
+
+# NFS share left mounted between operations (released at exit)
+_nfs_state = {'path': None, 'opts': None, 'mount_point': None}
+
+# Title of the screen last drawn by draw_main_layout
+_layout_state = {'title': "Main Menu"}
+
+# Short-lived cache of get_devices() shared by the device selectors
+_devices_cache = {'ts': 0.0, 'val': None}
+
+# Log pad rows allocated at startup, and the most it grows to before old lines are dropped
+LOG_PAD_INITIAL_ROWS = 64
+LOG_PAD_MAX_ROWS = 1000
 
 # --- Global logging object ---
 log = logging.getLogger(__name__)
 
+# Worker threads for slow probes (e.g. smartctl) run while the user is prompted
+_bg_executor = ThreadPoolExecutor(max_workers=2)
+
 # --- Helper Functions ---
 
 def check_root():
@@ -35,24 +205,14 @@ def check_root():
 def detect_optimal_block_size(device):
     """Detect optimal block size for a device based on physical and logical sector sizes."""
     try:
-        # Get physical block size (optimal I/O size)
-        phys_cmd = f"sudo blockdev --getpbsz {device}"
-        phys_result = subprocess.run(phys_cmd.split(), capture_output=True, text=True)
-        phys_size = int(phys_result.stdout.strip()) if phys_result.returncode == 0 else None
-        
-        # Get logical block size
-        log_cmd = f"sudo blockdev --getss {device}"
-        log_result = subprocess.run(log_cmd.split(), capture_output=True, text=True)
-        log_size = int(log_result.stdout.strip()) if log_result.returncode == 0 else None
-        
-        # Get optimal I/O size if available
-        opt_cmd = f"sudo blockdev --getioopt {device}"
-        opt_result = subprocess.run(opt_cmd.split(), capture_output=True, text=True)
-        if opt_result.returncode == 0:
-            opt_size = int(opt_result.stdout.strip()) if opt_result.stdout.strip() else 0
-        else:
-            opt_size = None
-            log.warning(f"Could not get optimal I/O size for {device}: {opt_result.stderr}")
+        # Physical, logical and optimal I/O sizes from a single blockdev run; it
+        # prints one value per query and stops at the first one that fails
+        bd_result = subprocess.run(["sudo", "blockdev", "--getpbsz", "--getss", "--getioopt", device],
+                                  capture_output=True, text=True)
+        values = [int(v) for v in bd_result.stdout.split()] + [None, None, None]
+        phys_size, log_size, opt_size = values[:3]
+        if opt_size is None:
+            log.warning(f"Could not get optimal I/O size for {device}: {bd_result.stderr}")
         
         # Also try to get from fdisk as it sometimes reports different/additional info
         fdisk_opt_size = None
@@ -146,33 +306,32 @@ def get_block_size_choice(stdscr, app_h, operation_type="operation", device=None
             "(Selected for optimal alignment and performance)"
         ], app_h)
         
-        block_size_options = [
-            f"{detected['recommended_str']} - RECOMMENDED for alignment (detected)",
-            "512 bytes - Traditional sector size, slowest",
-            "4K - Modern sector size, good balance",
-            "64K - Fast for most drives",
-            "1M - Fastest for large sequential operations"
+        block_size_choices = [
+            (f"{detected['recommended_str']} - RECOMMENDED for alignment (detected)", detected['recommended_str'], detected['recommended']),
+            ("512 bytes - Traditional sector size, slowest", "512", 512),
+            ("4K - Modern sector size, good balance", "4K", 4096),
+            ("64K - Fast for most drives", "64K", 65536),
+            ("1M - Fastest for large sequential operations", "1M", 1048576)
         ]
     else:
-        block_size_options = [
-            "64K - Recommended default",
-            "512 bytes - Traditional sector size, slowest",
-            "4K - Modern sector size, good balance",
-            "1M - Fastest for large sequential operations"
+        block_size_choices = [
+            ("64K - Recommended default", "64K", 65536),
+            ("512 bytes - Traditional sector size, slowest", "512", 512),
+            ("4K - Modern sector size, good balance", "4K", 4096),
+            ("1M - Fastest for large sequential operations", "1M", 1048576)
         ]
     
+    # Device writes use O_DIRECT, which rejects blocks that are not a multiple of
+    # the logical sector size; assume 4K sectors when the drive did not report one
+    sector_size = detected['logical'] if detected and detected['logical'] else 4096
+    block_size_choices = [c for c in block_size_choices if c[2] % sector_size == 0]
+    
     bs_idx = get_menu_choice(stdscr, f"Select Block Size for {operation_type}", 
-                             block_size_options, app_h)
+                             [c[0] for c in block_size_choices], app_h)
     if bs_idx == -1:
         return None  # User cancelled
     
-    # Map selection to actual block size
-    if detected:
-        block_sizes = [detected['recommended_str'], "512", "4K", "64K", "1M"]
-    else:
-        block_sizes = ["64K", "512", "4K", "1M"]
-    
-    return block_sizes[bs_idx]
+    return block_size_choices[bs_idx][1]
 
 def get_devices():
     """Get a list of block devices using lsblk, including their size in bytes."""
@@ -200,18 +359,316 @@ def get_devices():
         log.error(f"Failed to get devices: {e}")
         return []
 
+def get_cached_devices(ttl=3.0):
+    """Return get_devices(), reusing the last lsblk result for up to ttl seconds."""
+    now = time.monotonic()
+    if _devices_cache['val'] is None or now - _devices_cache['ts'] > ttl:
+        _devices_cache['val'] = get_devices()
+        _devices_cache['ts'] = now
+    return _devices_cache['val']
+
+def invalidate_devices_cache():
+    """Force the next get_cached_devices() call to rerun lsblk."""
+    _devices_cache['val'] = None
+
 def get_image_files(extension, directory='.'):
-    """Scans the specified directory for files with a given extension."""
+    """Scans the specified directory for files with a given extension (or tuple of extensions)."""
     try:
-        files = [f for f in os.listdir(directory) if os.path.isfile(os.path.join(directory, f)) and f.endswith(extension)]
-        return sorted(files)
+        with os.scandir(directory) as it:
+            return sorted(e.name for e in it if e.is_file() and e.name.endswith(extension))
     except OSError as e:
         log.error(f"Cannot read directory: {e}")
         return []
 
+def split_checksum_filename(filename):
+    """Split a checksum filename into (image filename, hash name)."""
+    for ext, hash_name in CHECKSUM_EXTS_MAP.items():
+        if filename.endswith(ext):
+            return filename[:-len(ext)], hash_name
+    return filename, None
+
+def calculate_checksums(path, algorithms):
+    """Hash a file in one pass for several hashlib algorithms; return hex digests in order."""
+    hashers = [hashlib.new(name) for name in algorithms]
+    
+    # Bind the update call(s) once so the read loop does no per-chunk dispatch
+    if len(hashers) == 1:
+        update = hashers[0].update
+    elif len(hashers) == 2:
+        update1, update2 = hashers[0].update, hashers[1].update
+        def update(chunk):
+            update1(chunk)
+            update2(chunk)
+    else:
+        updates = [h.update for h in hashers]
+        def update(chunk):
+            for u in updates:
+                u(chunk)
+    
+    # Reuse one buffer for the whole file instead of allocating per chunk
+    buf = bytearray(HASH_CHUNK_SIZE)
+    view = memoryview(buf)
+    with open(path, 'rb', buffering=0) as f:
+        readinto = f.readinto
+        while True:
+            n = readinto(buf)
+            if not n:
+                break
+            update(view[:n])
+    
+    return [h.hexdigest() for h in hashers]
+
+def splice_to_stdout(src_path):
+    """Stream a file or block device into stdout (a pipe) with splice(2).
+    
+    Like the dd source legs (DD_NET_SOURCE_OPTS), unreadable chunks are replaced
+    with zeros instead of aborting, and the copied range is dropped from the page
+    cache as it goes (splice can't take the O_DIRECT path dd uses). Writes
+    dd-style "N bytes copied" progress lines to stderr; returns an exit status.
+    """
+    out_fd = sys.stdout.fileno()
+    flags = os.SPLICE_F_MOVE | os.SPLICE_F_MORE
+    try:
+        src_fd = os.open(src_path, os.O_RDONLY)
+        size = os.lseek(src_fd, 0, os.SEEK_END)
+        os.lseek(src_fd, 0, os.SEEK_SET)
+    except OSError as e:
+        print(f"splice: cannot open '{src_path}': {e}", file=sys.stderr)
+        return 1
+    
+    copied = 0
+    dropped = 0
+    last_report = time.monotonic()
+    try:
+        while True:
+            try:
+                n = os.splice(src_fd, out_fd, SPLICE_CHUNK_SIZE, flags=flags)
+            except OSError as e:
+                if e.errno != errno.EIO or copied >= size:
+                    raise
+                # conv=noerror,sync: zero-fill the unreadable chunk and skip past it
+                n = min(SPLICE_CHUNK_SIZE, size - copied)
+                print(f"splice: error reading '{src_path}' at offset {copied}: {e}; "
+                      f"zero-filled {n} bytes", file=sys.stderr, flush=True)
+                zeros = memoryview(bytes(n))
+                while zeros:
+                    zeros = zeros[os.write(out_fd, zeros):]
+                os.lseek(src_fd, copied + n, os.SEEK_SET)
+            if not n:
+                break
+            copied += n
+            now = time.monotonic()
+            if now - last_report >= 1:
+                print(f"{copied} bytes copied", file=sys.stderr, flush=True)
+                last_report = now
+                os.posix_fadvise(src_fd, dropped, copied - dropped, os.POSIX_FADV_DONTNEED)
+                dropped = copied
+    except OSError as e:
+        print(f"splice: error reading '{src_path}': {e}", file=sys.stderr)
+        return 1
+    finally:
+        os.close(src_fd)
+    print(f"{copied} bytes copied", file=sys.stderr, flush=True)
+    return 0
+
+def get_random_stream_cmd():
+    """Return a shell command writing an endless random stream, or None to use /dev/urandom."""
+    if not OPENSSL_AVAILABLE:
+        return None
+    if CPU_HAS_AES:
+        cipher, key = "aes-128-ctr", os.urandom(16).hex()
+    else:
+        cipher, key = "chacha20", os.urandom(32).hex()
+    # A fresh key per pass; openssl complains on stderr when dd closes the pipe
+    return (f"openssl enc -{cipher} -nosalt -K {key} -iv {os.urandom(16).hex()} "
+            f"-in /dev/zero 2>/dev/null")
+
+def fill_pattern_to_stdout(pattern):
+    """Write an endless stream of one byte value (e.g. "0x55") to stdout.
+    
+    Used as the source of pattern wipe passes; returns 0 once the reader exits.
+    """
+    buf = bytes([int(pattern, 16)]) * FILL_BUFFER_SIZE
+    out_fd = sys.stdout.fileno()
+    try:
+        # Every byte is the same, so a short write needs no resume offset
+        while True:
+            os.write(out_fd, buf)
+    except BrokenPipeError:
+        return 0
+
+def quote_remote_path(path):
+    """Quote a path for the remote shell, leaving a leading ~ expandable to the remote home."""
+    if path == "~":
+        return '"$HOME"'
+    if path.startswith("~/"):
+        return '"$HOME"/' + shlex.quote(path[2:])
+    return shlex.quote(path)
+
+def _ssh_stream_cmd(ssh_user, ssh_host, remote_cmd):
+    """Build the argv for one SSH stream on its own connection (no shared master)."""
+    return ["ssh", *SSH_BULK_OPTS.split(), "-o", "BatchMode=yes",
+            f"{ssh_user}@{ssh_host}", remote_cmd]
+
+def ssh_stream_count(device):
+    """Return how many parallel SSH streams a raw transfer of device should use.
+    
+    1 means the single-stream splice/dd pipeline; only non-rotational disks are
+    striped unless SSH_STRIPE_ROTATIONAL is set.
+    """
+    if SSH_STREAMS < 2 or SSH_STRIPE_ROTATIONAL:
+        return SSH_STREAMS
+    name = os.path.basename(os.path.realpath(device))
+    try:
+        with open(f"/sys/block/{name}/queue/rotational", 'r') as f:
+            return SSH_STREAMS if f.read().strip() == "0" else 1
+    except OSError:
+        return 1
+
+def _pwrite_all(fd, data, offset):
+    """pwrite a whole buffer, retrying short writes."""
+    view = memoryview(data)
+    while view:
+        n = os.pwrite(fd, view, offset)
+        view = view[n:]
+        offset += n
+
+def ssh_stripe_copy(direction, ssh_user, ssh_host, remote_path, local_path, total_bytes, streams):
+    """Copy a raw image between a local device and a remote file over parallel SSH streams.
+    
+    direction is "backup" (local -> remote) or "restore" (remote -> local). Each
+    stream moves one contiguous range; the summed progress is written to stderr
+    as dd-style "N bytes copied" lines. Returns an exit status.
+    """
+    blocks = -(-total_bytes // STRIPE_BLOCK_SIZE)
+    per_stream = -(-blocks // streams)
+    safe_remote = quote_remote_path(remote_path)
+    copied = [0] * streams
+    
+    try:
+        if direction == "backup":
+            # Bypass the page cache like the dd path's iflag=direct; fall back
+            # to buffered reads where O_DIRECT is not supported
+            try:
+                local_fd = os.open(local_path, os.O_RDONLY | os.O_DIRECT)
+            except OSError:
+                local_fd = os.open(local_path, os.O_RDONLY)
+            # Truncate the remote file once; the streams then fill it in place
+            subprocess.run(_ssh_stream_cmd(ssh_user, ssh_host, f": > {safe_remote}"), check=True)
+        else:
+            local_fd = os.open(local_path, os.O_WRONLY)
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"stripe: cannot open '{local_path}' or '{remote_path}': {e}", file=sys.stderr)
+        return 1
+    
+    def run_stream(i):
+        first = i * per_stream
+        count = min(per_stream, blocks - first)
+        if count <= 0:
+            return 0
+        offset = first * STRIPE_BLOCK_SIZE
+        end = min(total_bytes, offset + count * STRIPE_BLOCK_SIZE)
+        dd_range = f"bs={STRIPE_BLOCK_SIZE} count={count} iflag=fullblock status=none"
+        if direction == "backup":
+            proc = subprocess.Popen(_ssh_stream_cmd(ssh_user, ssh_host,
+                                    f"dd of={safe_remote} seek={first} conv=notrunc {dd_range}"),
+                                    stdin=subprocess.PIPE)
+            # O_DIRECT needs an aligned buffer; anonymous mmaps are page aligned
+            buf = mmap.mmap(-1, STRIPE_BLOCK_SIZE)
+            view = memoryview(buf)
+            try:
+                while offset < end:
+                    chunk = view[:min(STRIPE_BLOCK_SIZE, end - offset)]
+                    try:
+                        n = os.preadv(local_fd, [chunk], offset)
+                    except OSError as e:
+                        if e.errno != errno.EIO:
+                            raise
+                        # conv=noerror,sync like the dd source legs: send zeros, skip ahead
+                        print(f"stripe {i}: error reading '{local_path}' at offset {offset}: {e}; "
+                              f"zero-filled {len(chunk)} bytes", file=sys.stderr, flush=True)
+                        chunk[:] = bytes(len(chunk))
+                        n = len(chunk)
+                    if not n:
+                        break
+                    proc.stdin.write(view[:n])
+                    offset += n
+                    copied[i] += n
+            finally:
+                view.release()
+                buf.close()
+                try:
+                    proc.stdin.close()
+                except OSError:
+                    pass
+        else:
+            proc = subprocess.Popen(_ssh_stream_cmd(ssh_user, ssh_host,
+                                    f"dd if={safe_remote} skip={first} {dd_range}"),
+                                    stdout=subprocess.PIPE)
+            while True:
+                data = proc.stdout.read(STRIPE_BLOCK_SIZE)
+                if not data:
+                    break
+                _pwrite_all(local_fd, data, offset)
+                offset += len(data)
+                copied[i] += len(data)
+        return proc.wait()
+    
+    with ThreadPoolExecutor(max_workers=streams) as pool:
+        futures = [pool.submit(run_stream, i) for i in range(streams)]
+        while not all(f.done() for f in futures):
+            time.sleep(1)
+            print(f"{sum(copied)} bytes copied", file=sys.stderr, flush=True)
+    
+    ok = True
+    for i, future in enumerate(futures):
+        error = future.exception()
+        if error is not None:
+            print(f"stripe {i}: error writing: {error}", file=sys.stderr)
+            ok = False
+        elif future.result() != 0:
+            print(f"stripe {i}: ssh exited with status {future.result()}", file=sys.stderr)
+            ok = False
+    try:
+        if direction == "restore":
+            os.fsync(local_fd)
+    except OSError as e:
+        print(f"stripe: fsync failed: {e}", file=sys.stderr)
+        ok = False
+    finally:
+        os.close(local_fd)
+    
+    print(f"{sum(copied)} bytes copied", file=sys.stderr, flush=True)
+    return 0 if ok and sum(copied) == total_bytes else 1
+
+def get_ssh_file_size(ssh_user, ssh_host, path):
+    """Return the size of a remote regular file in bytes, or None if unknown."""
+    cmd = ["ssh", *shlex.split(ssh_fast_opts()), "-o", "BatchMode=yes", f"{ssh_user}@{ssh_host}",
+           f"stat -L -c %s {quote_remote_path(path)}"]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=15)
+        return int(result.stdout.strip()) if result.returncode == 0 else None
+    except (subprocess.TimeoutExpired, ValueError) as e:
+        log.warning(f"Could not get size of remote file {path}: {e}")
+        return None
+
 def get_uncompressed_size(gz_path):
-    """Get the uncompressed size of a .gz file."""
+    """Get the uncompressed size of a .gz, .zst or .xz file."""
     try:
+        if gz_path.endswith('.xz'):
+            # Robot format: the 'totals' line holds the uncompressed size in field 5
+            cmd = ["xz", "--robot", "--list", gz_path]
+            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            for line in result.stdout.splitlines():
+                if line.startswith('totals'):
+                    return int(line.split('\t')[4])
+            return 0
+        if gz_path.endswith('.zst'):
+            # Only known when the frame header records it; streamed backups do not
+            cmd = ["zstd", "-lv", gz_path]
+            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            match = re.search(r'Decompressed Size:.*\((\d+) B\)', result.stdout)
+            return int(match.group(1)) if match else 0
         cmd = ["gzip", "-l", gz_path]
         result = subprocess.run(cmd, capture_output=True, text=True, check=True)
         lines = result.stdout.strip().split('\n')
@@ -492,6 +949,9 @@ def unmount_device(device):
             else:
                 log.info(f"Successfully unmounted {partition}")
         
+        # Removable media may be auto-ejected once unmounted
+        invalidate_devices_cache()
+        
         if failed_unmounts:
             return False, f"Failed to unmount: {', '.join(failed_unmounts)}"
         
@@ -515,10 +975,71 @@ def unmount_device(device):
         log.error(f"Exception during unmount: {e}")
         return False, str(e)
 
+def get_device_mount_points(device):
+    """Return the mount points of a device and its partitions, as listed by lsblk."""
+    try:
+        result = subprocess.run(["lsblk", "-ln", "-o", "MOUNTPOINT", device],
+                                capture_output=True, text=True, timeout=10)
+    except subprocess.TimeoutExpired:
+        log.warning(f"Could not list mount points of {device}")
+        return []
+    # Skips unmounted partitions and swap ("[SWAP]")
+    return [line.strip() for line in result.stdout.splitlines() if line.startswith('/')]
+
+def offer_source_trim(stdscr, device, log_pad, log_win_height):
+    """Offer to fstrim a backup source's mounted filesystems; returns the number trimmed."""
+    if not FSTRIM_AVAILABLE:
+        return 0
+    mount_points = get_device_mount_points(device)
+    if not mount_points:
+        return 0
+    
+    app_h = draw_main_layout(stdscr, "Trim Source", log_pad, log_win_height)
+    if not show_confirmation(stdscr, "Trim Before Backup?", [
+        f"{device} has {len(mount_points)} mounted filesystem(s).",
+        "fstrim discards their free space so it compresses away in the image.",
+        "",
+        "WARNING: discarded blocks cannot be recovered. Deleted files that could",
+        "otherwise be recovered from the image will be lost from the source disk.",
+        "",
+        "Trim the source filesystems now?"
+    ], app_h):
+        log.info(f"fstrim skipped for {device}")
+        return 0
+    
+    trimmed = 0
+    stdscr.timeout(100)
+    try:
+        for i, mount_point in enumerate(mount_points, 1):
+            app_h = draw_main_layout(stdscr, "Trim Source", log_pad, log_win_height)
+            wait_win = show_wait_overlay(stdscr, app_h, f"Trimming {mount_point} ({i}/{len(mount_points)})...",
+                                         "Esc/q to skip")
+            
+            proc = subprocess.Popen(["sudo", "fstrim", "-v", mount_point],
+                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            while proc.poll() is None:
+                if stdscr.getch() in (27, ord('q'), ord('Q')):
+                    proc.terminate()
+                    break
+            out, err = proc.communicate()
+            del wait_win
+            if proc.returncode == 0:
+                log.info(f"fstrim: {out.strip()}")
+                trimmed += 1
+            else:
+                log.warning(f"fstrim skipped or failed on {mount_point}: {err.strip()}")
+    finally:
+        stdscr.timeout(-1)
+    return trimmed
+
+def is_valid_ssh_name(name):
+    """Return True if name is usable as an SSH user or host (no shell or ssh option syntax)."""
+    return SSH_NAME_RE.match(name) is not None
+
 def test_ssh_connection(host, user, port=22):
     """Test SSH connection to remote host."""
     try:
-        cmd = ["ssh", "-p", str(port), "-o", "ConnectTimeout=5",
+        cmd = ["ssh", *shlex.split(ssh_fast_opts()), "-p", str(port), "-o", "ConnectTimeout=5",
                "-o", "BatchMode=yes", f"{user}@{host}", "echo", "SSH_OK"]
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
         if result.returncode == 0 and "SSH_OK" in result.stdout:
@@ -536,6 +1057,8 @@ def test_ssh_connection(host, user, port=22):
 
 def check_nfs_mount(nfs_path):
     """Check if NFS path is accessible."""
+    if _nfs_state['path'] == nfs_path and os.path.ismount(_nfs_state['mount_point']):
+        return True, "NFS share already mounted"
     try:
         # Parse NFS path (server:/path)
         if ':' not in nfs_path:
@@ -556,6 +1079,149 @@ def check_nfs_mount(nfs_path):
         log.error(f"NFS check error: {e}")
         return False, str(e)
 
+def _tune_nfs_readahead(mount_point):
+    """Raise readahead on the backing device of an NFS mount."""
+    try:
+        target = os.path.realpath(mount_point)
+        bdi_id = None
+        with open('/proc/self/mountinfo', 'r') as f:
+            for line in f:
+                fields = line.split()
+                # Field 3 is major:minor, field 5 the mount point; the last match wins
+                if len(fields) > 4 and fields[4] == target:
+                    bdi_id = fields[2]
+        if not bdi_id:
+            log.warning(f"Could not find {mount_point} in mountinfo, readahead unchanged")
+            return False
+        with open(f"/sys/class/bdi/{bdi_id}/read_ahead_kb", 'w') as f:
+            f.write(str(NFS_READ_AHEAD_KB))
+        log.info(f"Set NFS readahead to {NFS_READ_AHEAD_KB} KiB for {mount_point} (bdi {bdi_id})")
+        return True
+    except OSError as e:
+        log.warning(f"Could not tune NFS readahead for {mount_point}: {e}")
+        return False
+
+def check_fscache():
+    """Check once whether cachefilesd is running, so NFS 'fsc' mounts actually cache."""
+    if _fscache_state['active'] is None:
+        active = False
+        if shutil.which("cachefilesd"):
+            try:
+                result = subprocess.run(["systemctl", "is-active", "--quiet", "cachefilesd"],
+                                        capture_output=True, timeout=5)
+                active = result.returncode == 0
+            except (OSError, subprocess.TimeoutExpired) as e:
+                log.warning(f"Could not query cachefilesd status: {e}")
+        _fscache_state['active'] = active
+        log.info(f"FS-Cache (cachefilesd) for NFS restores: {'active' if active else 'inactive'}")
+    return _fscache_state['active']
+
+def mount_nfs(nfs_path, mount_point, extra_opts=None):
+    """Mount an NFS share with bulk-transfer options, falling back to defaults.
+    
+    extra_opts is appended to the mount options (e.g. "fsc" for restores).
+    The mount is kept for later operations and reused when the same share is
+    requested with the same options. Returns the CompletedProcess of the last
+    mount attempt.
+    """
+    if (_nfs_state['path'] == nfs_path and _nfs_state['opts'] == extra_opts
+            and _nfs_state['mount_point'] == mount_point and os.path.ismount(mount_point)):
+        log.info(f"Reusing NFS mount of {nfs_path} at {mount_point}")
+        return subprocess.CompletedProcess([], 0)
+    release_nfs_mount()
+    
+    os.makedirs(mount_point, exist_ok=True)
+    mount_opts = f"{NFS_MOUNT_OPTS},{extra_opts}" if extra_opts else NFS_MOUNT_OPTS
+    mount_cmd = ["sudo", "mount", "-t", "nfs", "-o", mount_opts, nfs_path, mount_point]
+    mount_result = subprocess.run(mount_cmd, capture_output=True)
+    if mount_result.returncode != 0:
+        # Older kernels/servers may reject options such as nconnect
+        log.warning(f"NFS mount with tuned options failed, retrying with defaults: "
+                    f"{mount_result.stderr.decode(errors='replace').strip()}")
+        fallback_opts = ["-o", extra_opts] if extra_opts else []
+        mount_cmd = ["sudo", "mount", "-t", "nfs", *fallback_opts, nfs_path, mount_point]
+        mount_result = subprocess.run(mount_cmd, capture_output=True)
+    if mount_result.returncode == 0:
+        _tune_nfs_readahead(mount_point)
+        _nfs_state.update(path=nfs_path, opts=extra_opts, mount_point=mount_point)
+    return mount_result
+
+MNT_DETACH = 2  # umount2(2) flag for a lazy unmount
+_libc = None
+
+def umount_lazy(mount_point):
+    """Lazily unmount mount_point, calling umount2(2) directly when running as root."""
+    global _libc
+    if os.geteuid() == 0:
+        try:
+            if _libc is None:
+                # The running process already has libc loaded; find_library would spawn ldconfig
+                _libc = ctypes.CDLL(None, use_errno=True)
+            if _libc.umount2(os.fsencode(mount_point), MNT_DETACH) == 0:
+                return True
+            log.warning(f"umount2 failed on {mount_point}: {os.strerror(ctypes.get_errno())}")
+        except (OSError, AttributeError):
+            pass
+    return subprocess.run(["sudo", "umount", "-l", mount_point], capture_output=True).returncode == 0
+
+def release_nfs_mount():
+    """Unmount the NFS share kept mounted by mount_nfs, if any."""
+    mount_point = _nfs_state['mount_point']
+    if not mount_point:
+        return
+    _nfs_state.update(path=None, opts=None, mount_point=None)
+    if os.path.ismount(mount_point):
+        umount_lazy(mount_point)
+    try:
+        os.rmdir(mount_point)
+    except OSError:
+        pass
+
+atexit.register(release_nfs_mount)
+
+def get_ssh_control_dir():
+    """Return the private (0700) SSH socket directory, creating it on first use."""
+    if _ssh_control_state['dir'] is None:
+        _ssh_control_state.update(dir=tempfile.mkdtemp(prefix="ddi-ssh-"), pid=os.getpid())
+    return _ssh_control_state['dir']
+
+def ssh_fast_opts():
+    """SSH options for transfers that share the master connection."""
+    control_path = shlex.quote(os.path.join(get_ssh_control_dir(), '%C'))
+    return (f"{SSH_BULK_OPTS} -o ControlMaster=auto -o ControlPath={control_path} "
+            f"-o ControlPersist={SSH_CONTROL_PERSIST}")
+
+def close_ssh_masters():
+    """Stop the SSH masters kept alive by ControlPersist and remove their socket directory."""
+    control_dir = _ssh_control_state['dir']
+    if control_dir is None or _ssh_control_state['pid'] != os.getpid():
+        return
+    try:
+        sockets = [entry.path for entry in os.scandir(control_dir)]
+    except OSError:
+        return
+    for path in sockets:
+        try:
+            # The destination is only used for token expansion; the socket is named explicitly
+            subprocess.run(["ssh", "-o", f"ControlPath={path}", "-O", "exit", "ddi"],
+                           capture_output=True, timeout=10)
+        except subprocess.TimeoutExpired:
+            log.warning(f"Could not stop SSH master {path}")
+    shutil.rmtree(control_dir, ignore_errors=True)
+
+atexit.register(close_ssh_masters)
+
+def drop_file_cache(path):
+    """Ask the kernel to drop the cached pages of a file that was streamed once."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except (OSError, AttributeError):
+        pass
+
 def check_free_space(path, required_bytes):
     """Check if there is enough free space at the given path."""
     try:
@@ -574,6 +1240,64 @@ def check_free_space(path, required_bytes):
         log.error(f"Could not check free space: {e}")
         return None, "Unknown", format_bytes(required_bytes)
 
+def check_ssh_free_space(ssh_user, ssh_host, path, required_bytes):
+    """Check free space on a remote path over SSH; returns like check_free_space."""
+    remote_cmd = f"df -B1 --output=avail {quote_remote_path(path)}"
+    cmd = (f"ssh {ssh_fast_opts()} -o ConnectTimeout=10 {shlex.quote(ssh_user + '@' + ssh_host)} "
+           f"{shlex.quote(remote_cmd)}")
+    try:
+        result = subprocess.run(cmd, shell=True, capture_output=True,
+                              text=True, timeout=15)
+        free_bytes = int(result.stdout.split()[-1])
+    except (subprocess.TimeoutExpired, ValueError, IndexError) as e:
+        log.error(f"Could not check remote free space: {e}")
+        return None, "Unknown", format_bytes(required_bytes)
+    
+    free_str = format_bytes(free_bytes)
+    required_str = format_bytes(required_bytes)
+    if free_bytes >= required_bytes:
+        log.info(f"Remote free space check: {free_str} available, {required_str} required - OK")
+        return True, free_str, required_str
+    log.warning(f"Remote free space check: {free_str} available, {required_str} required - INSUFFICIENT")
+    return False, free_str, required_str
+
+def estimate_backup_size(device_bytes, compressed):
+    """Estimate the space a backup image needs on the destination."""
+    if compressed:
+        return int(device_bytes * 0.5)
+    return int(device_bytes * 1.02)
+
+def confirm_backup_space(stdscr, space_check, compressed, log_pad, log_win_height):
+    """Refuse a backup that cannot fit; ask when the size is only an estimate.
+    
+    Returns True if the backup should go ahead.
+    """
+    has_space, free_str, required_str = space_check
+    if has_space is not False:
+        return True
+    
+    app_h = draw_main_layout(stdscr, "Insufficient Space", log_pad, log_win_height)
+    if not compressed:
+        show_message_box(stdscr, "Insufficient Space", [
+            f"Free space: {free_str}",
+            f"Required: {required_str}",
+            "The destination cannot hold this image."
+        ], app_h)
+        return False
+    return show_confirmation(stdscr, "Low Disk Space Warning", [
+        f"Free space: {free_str}",
+        f"Required: {required_str} (estimated)",
+        "Insufficient space available. Continue anyway?"
+    ], app_h)
+
+def backup_file_name(entered, default):
+    """Reduce an entered backup filename to a plain name inside the destination directory.
+    
+    An absolute or nested path would otherwise replace or escape that directory.
+    """
+    name = os.path.basename((entered or "").rstrip('/'))
+    return default if name in ("", ".", "..") else name
+
 def generate_filename(base_name, device_name, extension):
     """Generate a filename with timestamp and device info."""
     from datetime import datetime
@@ -602,10 +1326,12 @@ class CursesHandler(logging.Handler):
     def __init__(self, screen_pad):
         super().__init__()
         self.screen_pad = screen_pad
-        self.log_messages = []
+        self.log_messages = []  # One per pad row; trimmed when the pad fills up
+        self._pad_rows = 0  # Messages already written to the pad
         self.stdscr = None  # Will be set to main stdscr for proper refresh
         self.log_win_height = 8  # Default log window height
         self.scroll_pos = 0  # Current scroll position for log window
+        self._log_dirty = False  # Messages logged since the pad was last shown
 
     def set_stdscr(self, stdscr):
         """Set the main screen reference for proper log window positioning."""
@@ -618,24 +1344,45 @@ class CursesHandler(logging.Handler):
     def emit(self, record):
         msg = self.format(record)
         self.log_messages.append(msg)
+        self._log_dirty = True
         
-        # Redraw the pad with new message
-        h, w = self.screen_pad.getmaxyx()
-        self.screen_pad.clear()
+        # curses is not thread-safe; background records are drawn by the next
+        # main-thread record or screen redraw (draw_main_layout, refresh_log_window)
+        if threading.current_thread() is not threading.main_thread():
+            return
         
-        start_line = max(0, len(self.log_messages) - (h - 1))
-        for i, line in enumerate(self.log_messages[start_line:]):
-            self.screen_pad.addstr(i, 0, line[:w-1])
+        self.flush_to_pad()
         
         # Refresh the log window area if we have screen reference
         if self.stdscr:
             try:
                 main_h, main_w = self.stdscr.getmaxyx()
-                log_win_height = 8  # Same as in main function
-                log_win_y = main_h - log_win_height
+                log_win_y = main_h - self.log_win_height
+                start_line = max(0, len(self.log_messages) - (self.log_win_height - 2))
                 self.screen_pad.refresh(start_line, 0, log_win_y + 1, 2, main_h - 2, main_w - 3)
+                self._log_dirty = False
             except:
                 pass  # Ignore refresh errors
+    
+    def flush_to_pad(self):
+        """Write pending messages to the pad, touching only their rows."""
+        # Worker threads append under the handler lock (reentrant from emit)
+        with self.lock:
+            h, w = self.screen_pad.getmaxyx()
+            if len(self.log_messages) > h - 1 and h < LOG_PAD_MAX_ROWS:
+                # Grow the pad with the log rather than allocating every row up front
+                h = min(max(h * 2, len(self.log_messages) + 1), LOG_PAD_MAX_ROWS)
+                self.screen_pad.resize(h, w)
+            if len(self.log_messages) > h - 1:
+                # Pad is full: keep the newest half and redraw it from the top
+                del self.log_messages[:len(self.log_messages) - (h - 1) // 2]
+                self.screen_pad.erase()
+                self._pad_rows = 0
+            
+            end = len(self.log_messages)
+            for i in range(self._pad_rows, end):
+                self.screen_pad.addstr(i, 0, self.log_messages[i][:w-1])
+            self._pad_rows = end
 
 def setup_logging(curses_pad, stdscr=None):
     """Configures file and curses logging."""
@@ -678,10 +1425,12 @@ def draw_main_layout(stdscr, title, log_pad, log_win_height, log_focused=False):
         log.error(f"Failed to get screen size: {e}")
         raise
     app_h = h - log_win_height
+    _layout_state['title'] = title  # Lets a menu redraw the same screen after a resize
     
-    # Clear entire screen and redraw background
-    stdscr.clear()
+    # Erase and redraw the background; unlike clear() this lets curses send only
+    # the cells that changed, so redrawing the same frame costs next to nothing
     stdscr.bkgd(' ', curses.color_pair(1))
+    stdscr.erase()
     
     # Draw header with version
     header = f"{APP_NAME} v{VERSION} - {title}"
@@ -695,10 +1444,6 @@ def draw_main_layout(stdscr, title, log_pad, log_win_height, log_focused=False):
     stdscr.attroff(curses.color_pair(5))
     stdscr.hline(1, 1, curses.ACS_HLINE, w - 2)
     
-    # Fill the main area with background color
-    for y in range(2, app_h - 1):
-        stdscr.hline(y, 0, ' ', w)
-    
     # Log window border and title
     log_win_y = h - log_win_height
     stdscr.hline(log_win_y, 1, curses.ACS_HLINE, w - 2)
@@ -723,16 +1468,23 @@ def draw_main_layout(stdscr, title, log_pad, log_win_height, log_focused=False):
             curses_handler = handler
             break
     if curses_handler:
+        # Draw records logged by worker threads before scrolling to them
+        curses_handler.flush_to_pad()
         pad_start_line = max(0, len(curses_handler.log_messages) - (log_win_height - 2))
     else:
         pad_start_line = 0
-    log_pad.refresh(pad_start_line, 0, log_win_y + 1, 2, h - 2, w - 3)
     
-    stdscr.refresh()
+    # Stage the screen, then the log pad over it, and write both in one update
+    stdscr.noutrefresh()
+    log_pad.noutrefresh(pad_start_line, 0, log_win_y + 1, 2, h - 2, w - 3)
+    curses.doupdate()
     return app_h # Return height available for dialogs
 
-def refresh_log_window(stdscr):
-    """Refresh the log window to ensure it's always visible."""
+def refresh_log_window(stdscr, batch=False):
+    """Refresh the log window to ensure it's always visible.
+    
+    With batch=True the pad is only staged and the caller must finish with curses.doupdate().
+    """
     # Get the curses handler to access log messages
     curses_handler = None
     for handler in log.handlers:
@@ -745,12 +1497,32 @@ def refresh_log_window(stdscr):
             h, w = stdscr.getmaxyx()
             log_win_height = curses_handler.log_win_height
             log_win_y = h - log_win_height
+            # Draw records logged by worker threads before scrolling to them
+            curses_handler.flush_to_pad()
             pad_start_line = max(0, len(curses_handler.log_messages) - (log_win_height - 2))
-            curses_handler.screen_pad.refresh(pad_start_line, 0, log_win_y + 1, 2, h - 2, w - 3)
+            if batch:
+                curses_handler.screen_pad.noutrefresh(pad_start_line, 0, log_win_y + 1, 2, h - 2, w - 3)
+            else:
+                curses_handler.screen_pad.refresh(pad_start_line, 0, log_win_y + 1, 2, h - 2, w - 3)
         except Exception as e:
             # Don't crash if refresh fails - just skip it
             pass
 
+def show_wait_overlay(stdscr, app_h, msg, hint=""):
+    """Draw a centred "Please Wait" box over the app area and flush it; returns the window."""
+    _, w = stdscr.getmaxyx()
+    wait_w = min(w - 4, max(len(msg), 20) + 6)
+    wait_win = draw_bordered_window(stdscr, max(2, app_h // 2 - 3), max(1, (w - wait_w) // 2), 6, wait_w, "Please Wait")
+    try:
+        wait_win.addstr(2, 3, msg[:wait_w - 6], curses.color_pair(6) | curses.A_BOLD)
+        if hint:
+            wait_win.addstr(3, 3, hint[:wait_w - 6])
+    except:
+        pass
+    wait_win.noutrefresh()
+    curses.doupdate()
+    return wait_win
+
 def draw_bordered_window(stdscr, y, x, h, w, title):
     """Draws a bordered window (dialog box)."""
     win = stdscr.derwin(h, w, y, x)
@@ -880,6 +1652,20 @@ def get_menu_choice(stdscr, title, menu_items, app_h):
             # Handle menu navigation when menu is focused
             if key == curses.KEY_UP and current_row > 0: current_row -= 1
             elif key == curses.KEY_DOWN and current_row < len(menu_items) - 1: current_row += 1
+            elif key == curses.KEY_RESIZE:
+                # The size is measured once on entry; only a resize needs a new reading
+                curses.update_lines_cols()
+                h, w = stdscr.getmaxyx()
+                # Redraw the layout (staging the log pad over it) and recentre the menu
+                for handler in log.handlers:
+                    if isinstance(handler, CursesHandler):
+                        app_h = draw_main_layout(stdscr, _layout_state['title'],
+                                                 handler.screen_pad, log_win_height)
+                        break
+                start_y = max(0, (app_h - menu_height) // 2)
+                start_x = max(0, (w - menu_width) // 2)
+                del win
+                win_deleted = True
             # Handle number keys 1-9 for quick selection
             elif key >= ord('1') and key <= ord('9'):
                 num = key - ord('1')  # Convert to 0-based index
@@ -902,8 +1688,9 @@ def get_menu_choice(stdscr, title, menu_items, app_h):
                 except:
                     pass
                 stdscr.touchwin()
-                stdscr.refresh()
-                refresh_log_window(stdscr)
+                stdscr.noutrefresh()
+                refresh_log_window(stdscr, batch=True)
+                curses.doupdate()
                 return -1
             # Handle F1 or '?' for help
             elif key == curses.KEY_F1 or key == ord('?'):
@@ -1064,16 +1851,17 @@ def get_menu_choice(stdscr, title, menu_items, app_h):
                         # Clean up window before returning
                         del win
                         stdscr.touchwin()
-                        stdscr.refresh()
-                        refresh_log_window(stdscr)
+                        stdscr.noutrefresh()
+                        refresh_log_window(stdscr, batch=True)
+                        curses.doupdate()
                         return -1
                     
                     # Scroll wheel
-                    elif button_state & curses.BUTTON4_PRESSED:
+                    elif button_state & MOUSE_SCROLL_UP:
                         current_row = max(0, current_row - 1)
-                    elif button_state & curses.BUTTON5_PRESSED:
+                    elif button_state & MOUSE_SCROLL_DOWN:
                         current_row = min(len(menu_items) - 1, current_row + 1)
-                except:
+                except curses.error:
                     pass  # Ignore mouse errors
             elif key == 9:  # Tab key - switch to log window
                 log_focused = True
@@ -1081,17 +1869,19 @@ def get_menu_choice(stdscr, title, menu_items, app_h):
                 # Clean up window before returning
                 del win
                 stdscr.touchwin()
-                stdscr.refresh()
+                stdscr.noutrefresh()
                 # Ensure log is visible after cleanup
-                refresh_log_window(stdscr)
+                refresh_log_window(stdscr, batch=True)
+                curses.doupdate()
                 return current_row
             elif key == 27: 
                 # Clean up window before returning
                 del win
                 stdscr.touchwin()
-                stdscr.refresh()
+                stdscr.noutrefresh()
                 # Ensure log is visible after cleanup
-                refresh_log_window(stdscr)
+                refresh_log_window(stdscr, batch=True)
+                curses.doupdate()
                 return -1
 
 def get_input_string(stdscr, prompt, app_h, default_value="", show_path=None):
@@ -1162,7 +1952,7 @@ def get_input_string(stdscr, prompt, app_h, default_value="", show_path=None):
             # Clear mouse event from queue
             try:
                 curses.getmouse()
-            except:
+            except curses.error:
                 pass
             continue
         
@@ -1288,19 +2078,20 @@ def show_final_warning(stdscr, title, messages, app_h):
     # Clean up window before returning
     del win
     stdscr.touchwin()
-    stdscr.refresh()
-    refresh_log_window(stdscr)
+    stdscr.noutrefresh()
+    refresh_log_window(stdscr, batch=True)
+    curses.doupdate()
     
     return user_input.upper() == "YES"
 
 def get_compression_choice(stdscr, app_h):
     """Display compression options and return choice."""
     compression_options = [
-        "None - No compression (fastest, largest file)",
-        "gzip - Good compression, widely compatible (recommended)",
+        "zstd - Parallel, fast with excellent ratio (recommended)",
         "pigz - Parallel gzip (faster on multi-core CPUs)",
-        "zstd - Modern compression (fast, excellent ratio)",
-        "xz - Maximum compression (slowest, smallest file)"
+        "gzip - Good compression, widely compatible",
+        "xz - Parallel, maximum compression (slowest, smallest file)",
+        "None - No compression (fastest, largest file)"
     ]
     
     choice_idx = get_menu_choice(stdscr, "Select Compression Method", compression_options, app_h)
@@ -1309,15 +2100,39 @@ def get_compression_choice(stdscr, app_h):
     
     # Map to compression info: (extension, command, description)
     compression_map = {
-        0: (None, None, "no compression"),
-        1: (".gz", "gzip -c", "gzip compression"),
-        2: (".gz", "pigz -c", "parallel gzip compression"),
-        3: (".zst", "zstd -c", "zstd compression"),
-        4: (".xz", "xz -c", "xz compression")
+        0: (".zst", "zstd -c", "zstd (parallel) compression"),
+        1: (".gz", "pigz -c", "parallel gzip compression"),
+        2: (".gz", "gzip -c", "gzip compression"),
+        3: (".xz", "xz -c", "xz (parallel) compression"),
+        4: (None, None, "no compression")
     }
     
     return compression_map[choice_idx]
 
+def get_parallel_compression_cmd(compression_cmd):
+    """Return a multi-threaded equivalent of a compression command, if one is available."""
+    if compression_cmd in ("gzip -c", "pigz -c") and shutil.which("pigz"):
+        return f"pigz -c -p {PAR_THREADS}"
+    if compression_cmd == "zstd -c":
+        # --long=27 keeps the window within zstd's default decoder limit
+        return f"zstd -c -3 --long=27 -T{PAR_THREADS}"
+    if compression_cmd == "xz -c":
+        return f"xz -c -T{PAR_THREADS}"
+    return compression_cmd
+
+def get_gzip_decompression_cmd():
+    """Return the fastest available command for decompressing gzip to stdout."""
+    if shutil.which("unpigz"):
+        return f"unpigz -c -p {PAR_THREADS}"
+    return "gunzip -c"
+
+def get_decompression_cmd(filename):
+    """Return the command that decompresses an image to stdout, or None if it is raw."""
+    ext = os.path.splitext(filename)[1]
+    if ext == '.gz':
+        return get_gzip_decompression_cmd()
+    return DECOMPRESSION_CMDS.get(ext)
+
 def show_confirmation(stdscr, title, messages, app_h):
     """Displays a confirmation dialog with a red background."""
     _, w = stdscr.getmaxyx()
@@ -1352,7 +2167,7 @@ def show_confirmation(stdscr, title, messages, app_h):
         if key == curses.KEY_MOUSE:
             try:
                 curses.getmouse()  # Clear the mouse event
-            except:
+            except curses.error:
                 pass
             continue
         
@@ -1360,15 +2175,17 @@ def show_confirmation(stdscr, title, messages, app_h):
             # Clean up window before returning
             del win
             stdscr.touchwin()
-            stdscr.refresh()
-            refresh_log_window(stdscr)
+            stdscr.noutrefresh()
+            refresh_log_window(stdscr, batch=True)
+            curses.doupdate()
             return True
         elif key in [ord('n'), ord('N'), 27, ord('q'), ord('Q')]: 
             # Clean up window before returning
             del win
             stdscr.touchwin()
-            stdscr.refresh()
-            refresh_log_window(stdscr)
+            stdscr.noutrefresh()
+            refresh_log_window(stdscr, batch=True)
+            curses.doupdate()
             return False
 
 def show_message_box(stdscr, title, messages, app_h):
@@ -1406,18 +2223,19 @@ def show_message_box(stdscr, title, messages, app_h):
         if key == curses.KEY_MOUSE:
             try:
                 curses.getmouse()  # Clear the mouse event
-            except:
+            except curses.error:
                 pass
             continue  # Don't break, wait for keyboard
         else:
             # Any keyboard key
             break
     
-    # Clean up window before returning
+    # Clean up window before returning; only the rows it covered need repainting
     del win
-    stdscr.touchwin()
-    stdscr.refresh()
-    refresh_log_window(stdscr)
+    stdscr.touchline(start_y, win_h)
+    stdscr.noutrefresh()
+    refresh_log_window(stdscr, batch=True)
+    curses.doupdate()
 
 def run_utility_command(command):
     """Runs a utility command, captures its output, and logs it."""
@@ -1574,14 +2392,12 @@ def show_help_screen(stdscr, app_h):
         # Handle mouse scroll wheel
         elif key == curses.KEY_MOUSE:
             try:
-                _, mx, my, _, button_state = curses.getmouse()
-                # Scroll wheel up (button 4)
-                if button_state & curses.BUTTON4_PRESSED:
+                _, _, _, _, button_state = curses.getmouse()
+                if button_state & MOUSE_SCROLL_UP:
                     scroll_pos = max(0, scroll_pos - 3)
-                # Scroll wheel down (button 5)
-                elif button_state & (1 << 21):  # BUTTON5_PRESSED
+                elif button_state & MOUSE_SCROLL_DOWN:
                     scroll_pos = min(max_scroll, scroll_pos + 3)
-            except:
+            except curses.error:
                 pass
         # Close on Esc, q, Q, or F1
         elif key in [27, ord('q'), ord('Q'), curses.KEY_F1]:
@@ -1594,7 +2410,7 @@ def show_help_screen(stdscr, app_h):
     del win
     # Mark the entire screen for redraw
     stdscr.touchwin()
-    stdscr.refresh()
+    stdscr.noutrefresh()
     log.info("show_help_screen: Returning to menu")
 
 
@@ -1730,12 +2546,12 @@ def show_about_screen(stdscr, app_h):
         # Handle mouse scroll
         elif key == curses.KEY_MOUSE:
             try:
-                _, mx, my, _, button_state = curses.getmouse()
-                if button_state & curses.BUTTON4_PRESSED:  # Scroll up
+                _, _, _, _, button_state = curses.getmouse()
+                if button_state & MOUSE_SCROLL_UP:
                     scroll_pos = max(0, scroll_pos - 3)
-                elif button_state & (1 << 21):  # Scroll down
+                elif button_state & MOUSE_SCROLL_DOWN:
                     scroll_pos = min(max_scroll, scroll_pos + 3)
-            except:
+            except curses.error:
                 pass
         else:
             # Any other key closes the window
@@ -1746,7 +2562,7 @@ def show_about_screen(stdscr, app_h):
     win.refresh()
     del win
     stdscr.touchwin()
-    stdscr.refresh()
+    stdscr.noutrefresh()
 
 
 def format_bytes(b):
@@ -1824,9 +2640,9 @@ def ssh_list_directory(ssh_user, ssh_host, path):
     Returns (entries, error_message) where entries is a list of dicts,
     or (None, error_msg) if listing fails.
     """
-    # Escape path for shell
-    safe_path = path.replace("'", "'\\''")
-    cmd = f"ssh -o ConnectTimeout=10 {ssh_user}@{ssh_host} 'ls -la \"{safe_path}\" 2>&1'"
+    # Quote once for the remote shell and once for the local one
+    remote_cmd = f"ls -la {quote_remote_path(path)} 2>&1"
+    cmd = f"ssh {ssh_fast_opts()} -o ConnectTimeout=10 {shlex.quote(ssh_user + '@' + ssh_host)} {shlex.quote(remote_cmd)}"
     
     try:
         result = subprocess.run(cmd, shell=True, capture_output=True, 
@@ -2039,6 +2855,11 @@ def _refresh_log_window(stdscr):
         # Get log_pad from global log handler
         for handler in log.handlers:
             if isinstance(handler, CursesHandler):
+                # Nothing new since the pad was last shown; the progress
+                # windows never cover the log area, so skip the redraw
+                if not handler._log_dirty:
+                    break
+                handler.flush_to_pad()
                 log_pad = handler.screen_pad
                 log_win_height = handler.log_win_height
                 
@@ -2050,6 +2871,7 @@ def _refresh_log_window(stdscr):
                 
                 try:
                     log_pad.refresh(start_line, 0, log_win_y + 1, 2, h - 2, w - 3)
+                    handler._log_dirty = False
                 except:
                     pass
                 break
@@ -2071,9 +2893,7 @@ def run_dd_with_progress(stdscr, command_str, total_size_bytes, source_str, dest
     # Start the dd process once
     process = subprocess.Popen(command_str, shell=True, stderr=subprocess.PIPE, text=True, bufsize=1)
     start_time = time.time()
-    dd_re = re.compile(r"(\d+)\s+bytes")
-    error_re = re.compile(r"(error reading|error writing|Input/output error|Cannot allocate memory)", re.IGNORECASE)
-    stderr_lines = []
+    stderr_lines = deque(maxlen=STDERR_TAIL_LINES)
     
     # Track current display mode (can be toggled)
     current_mode = display_mode
@@ -2147,12 +2967,12 @@ def run_dd_with_progress(stdscr, command_str, total_size_bytes, source_str, dest
             break
         
         # Check for errors in dd output
-        if error_re.search(line):
+        if DD_ERROR_RE.search(line):
             # Record error at current position (we'll update the end when we get next byte count)
             log.warning(f"dd error detected: {line.strip()}")
             last_error_position = last_bytes_copied
             
-        match = dd_re.search(line)
+        match = DD_PROGRESS_RE.match(line) or PV_PROGRESS_RE.match(line)
         if not match: 
             continue
         
@@ -2577,8 +3397,7 @@ def run_dd_with_block_map(stdscr, command_str, total_size_bytes, source_str, des
     
     process = subprocess.Popen(command_str, shell=True, stderr=subprocess.PIPE, text=True, bufsize=1)
     start_time = time.time()
-    dd_re = re.compile(r"(\d+)\s+bytes")
-    stderr_lines = []
+    stderr_lines = deque(maxlen=STDERR_TAIL_LINES)
     
     # Calculate block map grid
     total_chars = map_width * map_height
@@ -2593,7 +3412,7 @@ def run_dd_with_block_map(stdscr, command_str, total_size_bytes, source_str, des
             stderr_lines.append(line)
         else:
             break
-        match = dd_re.search(line)
+        match = DD_PROGRESS_RE.match(line) or PV_PROGRESS_RE.match(line)
         if not match: continue
         
         bytes_copied = int(match.group(1))
@@ -2837,7 +3656,7 @@ def clone_logic(stdscr, log_pad, log_win_height):
         log.info("Clone cancelled - no block size selected.")
         return
 
-    full_cmd = f"sudo dd if={source_device['name']} of={target_device['name']} conv=sync,noerror bs={block_size} status=progress"
+    full_cmd = f"sudo dd if={source_device['name']} of={target_device['name']} {DD_DEVICE_WRITE_OPTS} conv=sync,noerror bs={block_size} status=progress"
 
     # Redraw layout for confirmation
     app_h = draw_main_layout(stdscr, "Local Clone Confirmation", log_pad, log_win_height)
@@ -2873,6 +3692,8 @@ def backup_logic(stdscr, log_pad, log_win_height):
     # Check if device is mounted
     is_mounted, mount_point = is_device_mounted(source_device['name'])
     if is_mounted:
+        # Trim while the filesystems are still mounted so unused blocks compress away
+        offer_source_trim(stdscr, source_device['name'], log_pad, log_win_height)
         app_h = draw_main_layout(stdscr, "Device Mounted", log_pad, log_win_height)
         if show_confirmation(stdscr, "Device Mounted", [
             f"Device {source_device['name']} is mounted at {mount_point}.",
@@ -2987,9 +3808,9 @@ def backup_logic(stdscr, log_pad, log_win_height):
     
     dd_cmd = f"sudo dd if={source_device['name']} conv=sync,noerror bs={block_size} status=progress"
     if compression_cmd:
-        full_cmd = f"{dd_cmd} | {compression_cmd} > \"{final_output_file}\""
+        full_cmd = f"{dd_cmd} | {compression_cmd} > {shlex.quote(final_output_file)}"
     else:
-        full_cmd = f"{dd_cmd} of=\"{final_output_file}\""
+        full_cmd = f"{dd_cmd} of={shlex.quote(final_output_file)}"
 
     # Redraw layout for final confirmation
     app_h = draw_main_layout(stdscr, "Local Backup Confirmation", log_pad, log_win_height)
@@ -3039,33 +3860,36 @@ def backup_logic(stdscr, log_pad, log_win_height):
                 # Build list of checksums to create
                 checksums_to_create = []
                 if create_md5:
-                    checksums_to_create.append(("MD5", "md5sum", ".md5"))
+                    checksums_to_create.append(("MD5", "md5", ".md5"))
                 if create_sha256:
-                    checksums_to_create.append(("SHA-256", "sha256sum", ".sha256"))
+                    checksums_to_create.append(("SHA-256", "sha256", ".sha256"))
                 
-                # Calculate checksums
+                # Calculate all checksums in a single read of the image
                 all_success = True
                 created_files = []
                 
-                for hash_name, hash_cmd, hash_ext in checksums_to_create:
+                log.info(f"Calculating checksum(s) for {final_output_file}")
+                try:
+                    digests = calculate_checksums(final_output_file,
+                                                  [algo for _, algo, _ in checksums_to_create])
+                except OSError as e:
+                    log.error(f"Failed to read {final_output_file} for checksum: {e}")
+                    digests = []
+                    all_success = False
+                
+                for (hash_name, _, hash_ext), digest in zip(checksums_to_create, digests):
                     checksum_file = f"{final_output_file}{hash_ext}"
-                    log.info(f"Calculating {hash_name} checksum for {final_output_file}")
+                    # Same line format as md5sum/sha256sum so '-c' can verify it
+                    checksum_output = f"{digest}  {final_output_file}"
+                    log.info(f"{hash_name} checksum calculated: {checksum_output}")
                     
                     try:
-                        result = subprocess.run([hash_cmd, final_output_file], capture_output=True, text=True, check=True)
-                        checksum_output = result.stdout.strip()
-                        log.info(f"{hash_name} checksum calculated: {checksum_output}")
-                        
                         # Write the checksum to file
                         with open(checksum_file, 'w') as f:
                             f.write(checksum_output + '\n')
                         
                         log.info(f"{hash_name} checksum file created: {checksum_file}")
                         created_files.append(f"{hash_name}: {os.path.basename(checksum_file)}")
-                    except subprocess.CalledProcessError as e:
-                        log.error(f"Failed to calculate {hash_name} checksum: {e}")
-                        log.error(f"STDERR: {e.stderr}")
-                        all_success = False
                     except Exception as e:
                         log.error(f"Exception while creating {hash_name} checksum: {e}")
                         all_success = False
@@ -3097,7 +3921,7 @@ def restore_logic(stdscr, log_pad, log_win_height):
         return
     
     app_h = draw_main_layout(stdscr, "Local Restore", log_pad, log_win_height)
-    image_files = get_image_files('.img', image_dir) + get_image_files('.img.gz', image_dir)
+    image_files = get_image_files(IMAGE_EXTS, image_dir)
     if not image_files:
         log.warning(f"No image files found in {image_dir}")
         show_message_box(stdscr, "No Images", [
@@ -3106,15 +3930,18 @@ def restore_logic(stdscr, log_pad, log_win_height):
         ], app_h)
         return
     
-    image_choice_idx = get_menu_choice(stdscr, "Select Image to Restore", sorted(image_files), app_h)
+    image_choice_idx = get_menu_choice(stdscr, "Select Image to Restore", image_files, app_h)
     if image_choice_idx == -1: 
         log.info("Restore cancelled.")
         return
-    image_filename = sorted(image_files)[image_choice_idx]
+    image_filename = image_files[image_choice_idx]
     image_file = os.path.join(image_dir, image_filename)
 
-    is_compressed = image_file.endswith('.gz')
-    total_size = get_uncompressed_size(image_file) if is_compressed else os.path.getsize(image_file)
+    decompress_cmd = get_decompression_cmd(image_file)
+    is_compressed = decompress_cmd is not None
+    # Size the compressed image in the background while the user answers the prompts
+    size_future = _bg_executor.submit(get_uncompressed_size, image_file) if is_compressed else None
+    total_size = 0 if is_compressed else os.path.getsize(image_file)
     
     # Auto-detect and offer to verify checksum if it exists
     checksum_md5 = f"{image_file}.md5"
@@ -3234,8 +4061,9 @@ def restore_logic(stdscr, log_pad, log_win_height):
         log.info("Restore cancelled - no block size selected.")
         return
 
-    dd_cmd = f"sudo dd of={target_device['name']} conv=sync,noerror bs={block_size} status=progress"
-    full_cmd = f"gunzip -c \"{image_file}\" | {dd_cmd}" if is_compressed else f"sudo dd if=\"{image_file}\" of={target_device['name']} conv=sync,noerror bs={block_size} status=progress"
+    # fullblock: a short read from the decompressor pipe must not be zero-padded by conv=sync
+    dd_cmd = f"sudo dd of={target_device['name']} iflag=fullblock {DD_DEVICE_WRITE_OPTS} conv=sync,noerror bs={block_size} status=progress"
+    full_cmd = f"{decompress_cmd} {shlex.quote(image_file)} | {dd_cmd}" if is_compressed else f"sudo dd if={shlex.quote(image_file)} of={target_device['name']} {DD_DEVICE_WRITE_OPTS} conv=sync,noerror bs={block_size} status=progress"
     
     # Redraw layout for confirmation
     app_h = draw_main_layout(stdscr, "Local Restore Confirmation", log_pad, log_win_height)
@@ -3253,6 +4081,9 @@ def restore_logic(stdscr, log_pad, log_win_height):
             "ALL DATA on the target device will be PERMANENTLY ERASED.",
             "This operation cannot be undone and will completely overwrite the target device."
         ], app_h):
+            if size_future is not None:
+                # Streamed zstd/xz images record no content size; scale to the device
+                total_size = size_future.result() or target_device['bytes']
             run_dd_with_progress(stdscr, full_cmd, total_size, image_file, target_device['name'], app_h)
 
 def checksum_logic(stdscr, log_pad, log_win_height):
@@ -3274,20 +4105,20 @@ def checksum_logic(stdscr, log_pad, log_win_height):
         return
     
     app_h = draw_main_layout(stdscr, "Create Checksum", log_pad, log_win_height)
-    image_files = get_image_files('.img', image_dir) + get_image_files('.img.gz', image_dir)
+    image_files = get_image_files(IMAGE_EXTS, image_dir)
     if not image_files:
         log.warning(f"No image files found in {image_dir}")
         show_message_box(stdscr, "No Images Found", [
-            f"No .img or .img.gz files found in:",
+            f"No {', '.join(IMAGE_EXTS)} files found in:",
             image_dir
         ], app_h)
         return
 
-    image_choice_idx = get_menu_choice(stdscr, "Select Image for Checksum", sorted(image_files), app_h)
+    image_choice_idx = get_menu_choice(stdscr, "Select Image for Checksum", image_files, app_h)
     if image_choice_idx == -1:
         log.info("Checksum creation cancelled.")
         return
-    image_filename = sorted(image_files)[image_choice_idx]
+    image_filename = image_files[image_choice_idx]
     image_file = os.path.join(image_dir, image_filename)
     
     # Choose hash algorithm
@@ -3306,9 +4137,9 @@ def checksum_logic(stdscr, log_pad, log_win_height):
     # Build list of checksums to create
     checksums_to_create = []
     if create_md5:
-        checksums_to_create.append(("MD5", "md5sum", ".md5"))
+        checksums_to_create.append(("MD5", "md5", ".md5"))
     if create_sha256:
-        checksums_to_create.append(("SHA-256", "sha256sum", ".sha256"))
+        checksums_to_create.append(("SHA-256", "sha256", ".sha256"))
     
     # Check if checksum files already exist
     existing_files = []
@@ -3333,29 +4164,31 @@ def checksum_logic(stdscr, log_pad, log_win_height):
         confirm_msg = [f"Create {hash_name} checksum for:", f"'{image_file}'?"]
     
     if show_confirmation(stdscr, "Confirm Checksum Creation", confirm_msg, app_h):
-        # Calculate the checksums
+        # Calculate all checksums in a single read of the image
         all_success = True
         created_files = []
         
-        for hash_name, hash_cmd, hash_ext in checksums_to_create:
+        log.info(f"Calculating checksum(s) for {image_file}")
+        try:
+            digests = calculate_checksums(image_file, [algo for _, algo, _ in checksums_to_create])
+        except OSError as e:
+            log.error(f"Failed to read {image_file} for checksum: {e}")
+            digests = []
+            all_success = False
+        
+        for (hash_name, _, hash_ext), digest in zip(checksums_to_create, digests):
             checksum_file = f"{image_file}{hash_ext}"
-            log.info(f"Calculating {hash_name} checksum for {image_file}")
+            # Same line format as md5sum/sha256sum so '-c' can verify it
+            checksum_output = f"{digest}  {image_file}"
+            log.info(f"{hash_name} checksum calculated: {checksum_output}")
             
             try:
-                result = subprocess.run([hash_cmd, image_file], capture_output=True, text=True, check=True)
-                checksum_output = result.stdout.strip()
-                log.info(f"{hash_name} checksum calculated: {checksum_output}")
-                
                 # Write the checksum to file
                 with open(checksum_file, 'w') as f:
                     f.write(checksum_output + '\n')
                 
                 log.info(f"{hash_name} checksum file created: {checksum_file}")
                 created_files.append(f"{hash_name}: {checksum_file}")
-            except subprocess.CalledProcessError as e:
-                log.error(f"Failed to calculate {hash_name} checksum: {e}")
-                log.error(f"STDERR: {e.stderr}")
-                all_success = False
             except Exception as e:
                 log.error(f"Exception while creating {hash_name} checksum: {e}")
                 all_success = False
@@ -3387,9 +4220,15 @@ def verify_logic(stdscr, log_pad, log_win_height):
         return
     
     app_h = draw_main_layout(stdscr, "Verify Image", log_pad, log_win_height)
-    md5_files = get_image_files('.md5', checksum_dir)
-    sha256_files = get_image_files('.sha256', checksum_dir)
-    checksum_files = md5_files + sha256_files
+    # Single directory pass: gives the checksum list and the set of existing
+    # files, so image names can be checked below without extra stat calls
+    try:
+        with os.scandir(checksum_dir) as it:
+            dir_files = {e.name for e in it if e.is_file()}
+    except OSError as e:
+        log.error(f"Cannot read directory: {e}")
+        dir_files = set()
+    checksum_files = sorted(f for f in dir_files if f.endswith(CHECKSUM_EXTS))
     
     if not checksum_files:
         log.warning(f"No checksum files found in {checksum_dir}")
@@ -3401,39 +4240,35 @@ def verify_logic(stdscr, log_pad, log_win_height):
 
     # Create descriptive menu items showing what each checksum verifies
     menu_items = []
-    for cf in sorted(checksum_files):
-        # Extract the image filename from checksum filename (remove .md5 or .sha256)
-        if cf.endswith('.md5'):
-            img_name = cf[:-4]  # Remove .md5
-            hash_type = "MD5"
-        else:
-            img_name = cf[:-7]  # Remove .sha256
-            hash_type = "SHA256"
+    for cf in checksum_files:
+        img_name, hash_type = split_checksum_filename(cf)
         menu_items.append(f"{img_name} ({hash_type})")
     
     checksum_choice_idx = get_menu_choice(stdscr, "Select Image to Verify", menu_items, app_h)
     if checksum_choice_idx == -1: log.info("Verify cancelled."); return
-    checksum_filename = sorted(checksum_files)[checksum_choice_idx]
+    checksum_filename = checksum_files[checksum_choice_idx]
     checksum_file = os.path.join(checksum_dir, checksum_filename)
     
     # Determine hash type from file extension
-    is_sha256 = checksum_file.endswith('.sha256')
-    hash_name = "SHA-256" if is_sha256 else "MD5"
+    image_filename_in_checksum, hash_name = split_checksum_filename(checksum_filename)
+    is_sha256 = hash_name == "SHA-256"
     
-    # Pre-flight check: ensure the file listed in the checksum file exists
+    # Pre-flight check: ensure the image exists. The checksum filename already
+    # names it, so the checksum file is only parsed when that image is missing.
     try:
-        with open(checksum_file, 'r') as f:
-            line = f.readline().strip()
-        # The format is HASH  FILENAME or HASH *FILENAME. The filename can contain spaces.
-        parts = line.split(None, 1)
-        if len(parts) < 2:
-            raise ValueError("Malformed checksum line")
-        # The filename part might start with a '*' for binary mode
-        image_filename_in_checksum = parts[1].lstrip('* ')
+        if image_filename_in_checksum not in dir_files:
+            with open(checksum_file, 'r') as f:
+                line = f.readline().strip()
+            # The format is HASH  FILENAME or HASH *FILENAME. The filename can contain spaces.
+            parts = line.split(None, 1)
+            if len(parts) < 2:
+                raise ValueError("Malformed checksum line")
+            # The filename part might start with a '*' for binary mode
+            image_filename_in_checksum = parts[1].lstrip('* ')
         
         # Check if image exists in the same directory as checksum file
         image_full_path = os.path.join(checksum_dir, image_filename_in_checksum)
-        if not os.path.exists(image_full_path):
+        if image_filename_in_checksum not in dir_files and not os.path.exists(image_full_path):
             log.error(f"Image file '{image_filename_in_checksum}' referenced in '{checksum_file}' does not exist.")
             show_message_box(stdscr, "Error", [
                 f"The image file '{image_filename_in_checksum}'",
@@ -3566,7 +4401,7 @@ def network_backup_ssh_only(stdscr, log_pad, log_win_height, protocol):
     nfs_mount_point = "/tmp/disk_imager_nfs"
     
     # Select source device
-    devices = get_devices()
+    devices = get_cached_devices()
     if not devices:
         log.error("No block devices found for backup.")
         show_message_box(stdscr, "Error", ["No block devices found."], app_h)
@@ -3579,9 +4414,14 @@ def network_backup_ssh_only(stdscr, log_pad, log_win_height, protocol):
         return
     source_device = devices[choice_idx]
     
+    # Start the SMART probe now so it runs while the user answers the prompts below
+    smart_future = _bg_executor.submit(check_smart_status, source_device['name'])
+    
     # Check if device is mounted
     is_mounted, mount_point = is_device_mounted(source_device['name'])
     if is_mounted:
+        # Trim while the filesystems are still mounted so unused blocks compress away
+        offer_source_trim(stdscr, source_device['name'], log_pad, log_win_height)
         app_h = draw_main_layout(stdscr, "Device Mounted", log_pad, log_win_height)
         if show_confirmation(stdscr, "Device Mounted", [
             f"Device {source_device['name']} is mounted at {mount_point}.",
@@ -3622,7 +4462,7 @@ def network_backup_ssh_only(stdscr, log_pad, log_win_height, protocol):
     
     # Check SMART status
     # Check SMART status
-    smart_ok, smart_info = check_smart_status(source_device['name'])
+    smart_ok, smart_info = smart_future.result()
     app_h = draw_main_layout(stdscr, "SMART Check", log_pad, log_win_height)
     if not show_smart_results(stdscr, source_device['name'], smart_ok, smart_info, app_h):
         log.info("Network backup cancelled - user declined after SMART check.")
@@ -3635,12 +4475,18 @@ def network_backup_ssh_only(stdscr, log_pad, log_win_height, protocol):
         if not ssh_host:
             log.info("Network backup cancelled.")
             return
+        if not is_valid_ssh_name(ssh_host):
+            show_message_box(stdscr, "Invalid Host", [f"Not a valid hostname or IP address: {ssh_host}"], app_h)
+            return
         
         app_h = draw_main_layout(stdscr, "SSH Details", log_pad, log_win_height)
         ssh_user = get_input_string(stdscr, "Enter SSH username", app_h)
         if not ssh_user:
             log.info("Network backup cancelled.")
             return
+        if not is_valid_ssh_name(ssh_user):
+            show_message_box(stdscr, "Invalid Username", [f"Not a valid username: {ssh_user}"], app_h)
+            return
         
         # Test SSH connection first (moved up for browsing)
         app_h = draw_main_layout(stdscr, "Testing Connection", log_pad, log_win_height)
@@ -3683,6 +4529,15 @@ def network_backup_ssh_only(stdscr, log_pad, log_win_height, protocol):
             return
         
         compression_ext, compression_cmd, compression_desc = compression_choice
+        compression_cmd = get_parallel_compression_cmd(compression_cmd)
+        
+        # Fail fast if the remote side cannot hold the image
+        required_space = estimate_backup_size(source_device['bytes'], bool(compression_cmd))
+        space_check = check_ssh_free_space(ssh_user, ssh_host, remote_dir, required_space)
+        if not confirm_backup_space(stdscr, space_check, bool(compression_cmd),
+                                    log_pad, log_win_height):
+            log.info("Network backup cancelled - insufficient remote space.")
+            return
         
         # Generate default filename with timestamp
         extension = ".img" + (compression_ext if compression_ext else "")
@@ -3693,20 +4548,31 @@ def network_backup_ssh_only(stdscr, log_pad, log_win_height, protocol):
         stdscr.refresh()
         app_h = draw_main_layout(stdscr, "Filename", log_pad, log_win_height)
         final_filename = get_input_string(stdscr, "Enter backup filename", app_h, default_filename)
-        if not final_filename:
-            final_filename = default_filename
+        final_filename = backup_file_name(final_filename, default_filename)
         
-        remote_path = f"{remote_dir}/{final_filename}"
+        # PurePosixPath also drops a trailing slash from the entered directory
+        remote_path = str(PurePosixPath(remote_dir) / final_filename)
         
         # Build SSH command
-        if compression_cmd:
-            full_cmd = (f"sudo dd if={source_device['name']} {DD_OPTS} "
-                       f"status=progress | {compression_cmd} | "
-                       f"ssh {ssh_user}@{ssh_host} 'cat > {remote_path}'")
+        streams = ssh_stream_count(source_device['name']) if compression_cmd is None else 1
+        if streams > 1:
+            # Raw images from SSDs are split across parallel SSH connections
+            full_cmd = (f"{SELF_CMD} --ssh-stripe backup {shlex.quote(ssh_user)} {shlex.quote(ssh_host)} "
+                       f"{shlex.quote(remote_path)} {source_device['name']} "
+                       f"{source_device['bytes']} {streams}")
         else:
-            full_cmd = (f"sudo dd if={source_device['name']} {DD_OPTS} "
-                       f"status=progress | "
-                       f"ssh {ssh_user}@{ssh_host} 'cat > {remote_path}'")
+            if compression_cmd is None and SPLICE_COPY_CMD:
+                # Uncompressed streams go from the device into the pipe with splice(2),
+                # skipping dd's copy through user space
+                cmd_parts = [f"{SPLICE_COPY_CMD} {source_device['name']}"]
+            else:
+                cmd_parts = [f"sudo dd if={source_device['name']} {DD_NET_OPTS} "
+                             f"{DD_NET_SOURCE_OPTS} status=progress"]
+            if compression_cmd:
+                cmd_parts.append(f"{MBUFFER_STAGE}{compression_cmd}")
+            cmd_parts.append(f"{MBUFFER_STAGE}ssh {ssh_fast_opts()} {shlex.quote(ssh_user + '@' + ssh_host)} "
+                             f"{shlex.quote('cat > ' + quote_remote_path(remote_path))}")
+            full_cmd = " | ".join(cmd_parts)
         
         dest_str = f"{ssh_user}@{ssh_host}:{remote_path}"
         
@@ -3729,9 +4595,7 @@ def network_backup_ssh_only(stdscr, log_pad, log_win_height, protocol):
         
         app_h = draw_main_layout(stdscr, "Network Backup", log_pad, log_win_height)
         # Mount NFS temporarily
-        os.makedirs(nfs_mount_point, exist_ok=True)
-        mount_cmd = f"sudo mount -t nfs {nfs_path} {nfs_mount_point}"
-        mount_result = subprocess.run(mount_cmd, shell=True, capture_output=True)
+        mount_result = mount_nfs(nfs_path, nfs_mount_point)
         
         if mount_result.returncode != 0:
             show_message_box(stdscr, "Mount Error", [
@@ -3746,6 +4610,15 @@ def network_backup_ssh_only(stdscr, log_pad, log_win_height, protocol):
             return
         
         compression_ext, compression_cmd, compression_desc = compression_choice
+        compression_cmd = get_parallel_compression_cmd(compression_cmd)
+        
+        # Fail fast if the NFS export cannot hold the image
+        required_space = estimate_backup_size(source_device['bytes'], bool(compression_cmd))
+        space_check = check_free_space(nfs_mount_point, required_space)
+        if not confirm_backup_space(stdscr, space_check, bool(compression_cmd),
+                                    log_pad, log_win_height):
+            log.info("Network backup cancelled - insufficient NFS space.")
+            return
         
         
         # Generate default filename with timestamp
@@ -3757,19 +4630,26 @@ def network_backup_ssh_only(stdscr, log_pad, log_win_height, protocol):
         stdscr.refresh()
         app_h = draw_main_layout(stdscr, "Filename", log_pad, log_win_height)
         final_filename = get_input_string(stdscr, "Enter backup filename", app_h, default_filename)
-        if not final_filename:
-            final_filename = default_filename
+        final_filename = backup_file_name(final_filename, default_filename)
         
         final_path = os.path.join(nfs_mount_point, final_filename)
+        final_path_q = shlex.quote(final_path)
         
         if compression_cmd:
-            full_cmd = (f"sudo dd if={source_device['name']} {DD_OPTS} "
-                       f"status=progress | {compression_cmd} > {final_path}")
+            full_cmd = " | ".join([
+                f"sudo dd if={source_device['name']} {DD_NET_OPTS} "
+                f"{DD_NET_SOURCE_OPTS} status=progress",
+                f"{compression_cmd} > {final_path_q}"
+            ])
         else:
-            full_cmd = (f"sudo dd if={source_device['name']} {DD_OPTS} "
-                       f"of={final_path} status=progress")
+            # Reserve the whole image up front so the server allocates it in one
+            # request; dd then overwrites it in place (fallocate may be unsupported)
+            full_cmd = (f": > {final_path_q}; "
+                       f"fallocate -l {source_device['bytes']} {final_path_q} 2>/dev/null; "
+                       f"sudo dd if={source_device['name']} {DD_NET_OPTS} {DD_NET_SOURCE_OPTS} "
+                       f"of={final_path_q} conv=notrunc,fsync status=progress")
         
-        dest_str = f"{nfs_path}/{final_filename}"
+        dest_str = f"{nfs_path.rstrip('/')}/{final_filename}"
     
     # Confirmation
     app_h = draw_main_layout(stdscr, "Network Backup Confirmation", 
@@ -3788,15 +4668,6 @@ def network_backup_ssh_only(stdscr, log_pad, log_win_height, protocol):
         ], app_h):
             run_dd_with_progress(stdscr, full_cmd, source_device['bytes'],
                                source_device['name'], dest_str, app_h)
-            
-            # Cleanup NFS mount if used
-            if protocol == "nfs":
-                subprocess.run(f"sudo umount {nfs_mount_point}", 
-                             shell=True, capture_output=True)
-                try:
-                    os.rmdir(nfs_mount_point)
-                except:
-                    pass
 
 def network_restore_ssh_only(stdscr, log_pad, log_win_height, protocol):
     """Network restore with pre-selected protocol (called from submenu)."""
@@ -3804,7 +4675,7 @@ def network_restore_ssh_only(stdscr, log_pad, log_win_height, protocol):
     nfs_mount_point = "/tmp/disk_imager_nfs"
     
     # Select target device
-    devices = get_devices()
+    devices = get_cached_devices()
     if not devices:
         log.error("No block devices found for restore.")
         show_message_box(stdscr, "Error", ["No block devices found."], app_h)
@@ -3819,6 +4690,9 @@ def network_restore_ssh_only(stdscr, log_pad, log_win_height, protocol):
         return
     target_device = devices[choice_idx]
     
+    # Start the SMART probe now so it runs while the user answers the prompts below
+    smart_future = _bg_executor.submit(check_smart_status, target_device['name'])
+    
     # Check if device is mounted
     is_mounted, mount_point = is_device_mounted(target_device['name'])
     if is_mounted:
@@ -3862,12 +4736,24 @@ def network_restore_ssh_only(stdscr, log_pad, log_win_height, protocol):
     
     # Check SMART status
     # Check SMART status
-    smart_ok, smart_info = check_smart_status(target_device['name'])
+    smart_ok, smart_info = smart_future.result()
     app_h = draw_main_layout(stdscr, "SMART Check", log_pad, log_win_height)
     if not show_smart_results(stdscr, target_device['name'], smart_ok, smart_info, app_h):
         log.info("Network restore cancelled - user declined after SMART check.")
         return
     
+    # Skipping zero blocks is much faster for mostly empty images but leaves the
+    # target's old contents in those ranges, so it is opt-in
+    app_h = draw_main_layout(stdscr, "Network Restore", log_pad, log_win_height)
+    sparse_restore = show_confirmation(stdscr, "Sparse Restore", [
+        "Skip writing all-zero blocks to the target?",
+        "Faster for mostly empty images, but old data on the",
+        "target is kept wherever the image is zero.",
+        "(No = exact block-for-block copy)"
+    ], app_h)
+    dd_write_opts = f"{DD_NET_DEVICE_OPTS} conv=sparse" if sparse_restore else DD_NET_DEVICE_OPTS
+    size_future = None
+    
     if protocol == "ssh":
         # Get SSH connection details
         app_h = draw_main_layout(stdscr, "SSH Details", log_pad, log_win_height)
@@ -3875,12 +4761,18 @@ def network_restore_ssh_only(stdscr, log_pad, log_win_height, protocol):
         if not ssh_host:
             log.info("Network restore cancelled.")
             return
+        if not is_valid_ssh_name(ssh_host):
+            show_message_box(stdscr, "Invalid Host", [f"Not a valid hostname or IP address: {ssh_host}"], app_h)
+            return
         
         app_h = draw_main_layout(stdscr, "SSH Details", log_pad, log_win_height)
         ssh_user = get_input_string(stdscr, "Enter SSH username", app_h)
         if not ssh_user:
             log.info("Network restore cancelled.")
             return
+        if not is_valid_ssh_name(ssh_user):
+            show_message_box(stdscr, "Invalid Username", [f"Not a valid username: {ssh_user}"], app_h)
+            return
         
         app_h = draw_main_layout(stdscr, "SSH Details", log_pad, log_win_height)
         # Test SSH connection first (needed for browsing)
@@ -3901,10 +4793,10 @@ def network_restore_ssh_only(stdscr, log_pad, log_win_height, protocol):
         ], app_h)
         
         if browse_choice:
-            # Browse remote files (filter for .img and .img.gz)
+            # Browse remote files (filter for image extensions)
             remote_file = ssh_browse_directory(stdscr, ssh_user, ssh_host,
                                               "/home", log_pad, log_win_height,
-                                              file_filter=['.img', '.img.gz'])
+                                              file_filter=list(IMAGE_EXTS))
             if not remote_file:
                 log.info("Network restore cancelled - no file selected.")
                 return
@@ -3916,27 +4808,49 @@ def network_restore_ssh_only(stdscr, log_pad, log_win_height, protocol):
                 return
         
         # Auto-detect compression from filename
-        is_compressed = remote_file.endswith('.gz')
-        
-        # Allow user to override if not compressed
-        app_h = draw_main_layout(stdscr, "Network Restore", log_pad, log_win_height)
-        if not is_compressed:
-            is_compressed = show_confirmation(stdscr, "Compression",
-                                            ["Is the remote file gzip compressed?"], app_h)
+        decompress_cmd = get_decompression_cmd(remote_file)
+        
+        # Ask for the format when the filename does not tell us
+        if not decompress_cmd:
+            app_h = draw_main_layout(stdscr, "Network Restore", log_pad, log_win_height)
+            format_idx = get_menu_choice(stdscr, "Remote Image Compression", [
+                "None - Raw image",
+                "zstd (.zst)",
+                "gzip (.gz)",
+                "xz (.xz)"
+            ], app_h)
+            if format_idx == -1:
+                log.info("Network restore cancelled.")
+                return
+            decompress_cmd = get_decompression_cmd(("", ".zst", ".gz", ".xz")[format_idx])
+        is_compressed = decompress_cmd is not None
         
         # Build SSH command
         if is_compressed:
-            full_cmd = (f"ssh {ssh_user}@{ssh_host} 'cat {remote_file}' | "
-                       f"gunzip -c | sudo dd of={target_device['name']} "
-                       f"{DD_OPTS} status=progress")
+            full_cmd = (f"ssh {ssh_fast_opts()} {shlex.quote(ssh_user + '@' + ssh_host)} {shlex.quote('cat ' + quote_remote_path(remote_file))} | "
+                       f"{MBUFFER_STAGE}{decompress_cmd} | "
+                       f"{MBUFFER_STAGE}sudo dd of={target_device['name']} {DD_NET_OPTS} "
+                       f"{dd_write_opts} status=progress")
         else:
-            full_cmd = (f"ssh {ssh_user}@{ssh_host} 'cat {remote_file}' | "
-                       f"sudo dd of={target_device['name']} {DD_OPTS} "
-                       f"status=progress")
+            full_cmd = (f"ssh {ssh_fast_opts()} {shlex.quote(ssh_user + '@' + ssh_host)} {shlex.quote('cat ' + quote_remote_path(remote_file))} | "
+                       f"{MBUFFER_STAGE}sudo dd of={target_device['name']} {DD_NET_OPTS} "
+                       f"{dd_write_opts} status=progress")
         
         source_str = f"{ssh_user}@{ssh_host}:{remote_file}"
         total_size = target_device['bytes']  # Estimate
         
+        # Raw images of known size are split across parallel SSH connections
+        # when the target is an SSD (sparse restores keep dd, which does the
+        # zero-block skipping)
+        streams = ssh_stream_count(target_device['name'])
+        if not is_compressed and not sparse_restore and streams > 1:
+            remote_size = get_ssh_file_size(ssh_user, ssh_host, remote_file)
+            if remote_size:
+                total_size = remote_size
+                full_cmd = (f"{SELF_CMD} --ssh-stripe restore {shlex.quote(ssh_user)} {shlex.quote(ssh_host)} "
+                           f"{shlex.quote(remote_file)} {target_device['name']} "
+                           f"{remote_size} {streams}")
+        
     else:  # NFS
         app_h = draw_main_layout(stdscr, "NFS Details", log_pad, log_win_height)
         nfs_path = get_input_string(stdscr, "Enter NFS path (server:/path)", app_h)
@@ -3954,10 +4868,17 @@ def network_restore_ssh_only(stdscr, log_pad, log_win_height, protocol):
             ], app_h)
             return
         
-        # Mount NFS temporarily
-        os.makedirs(nfs_mount_point, exist_ok=True)
-        mount_cmd = f"sudo mount -t nfs {nfs_path} {nfs_mount_point}"
-        mount_result = subprocess.run(mount_cmd, shell=True, capture_output=True)
+        # Without cachefilesd the 'fsc' option is accepted but caches nothing
+        if not check_fscache() and not _fscache_state['notified']:
+            _fscache_state['notified'] = True
+            show_message_box(stdscr, "FS-Cache Inactive", [
+                "cachefilesd is not installed or not running.",
+                "Repeat restores of the same image will be read",
+                "from the NFS server again instead of a local cache."
+            ], app_h)
+        
+        # Mount NFS temporarily (fsc lets repeat restores read from local cache)
+        mount_result = mount_nfs(nfs_path, nfs_mount_point, extra_opts="fsc")
         
         if mount_result.returncode != 0:
             show_message_box(stdscr, "Mount Error", [
@@ -3967,43 +4888,59 @@ def network_restore_ssh_only(stdscr, log_pad, log_win_height, protocol):
         
         # List available image files
         try:
-            files = [f for f in os.listdir(nfs_mount_point) 
-                    if f.endswith('.img') or f.endswith('.img.gz')]
+            # is_file() uses the d_type from readdir, so only the chosen image is stat'ed
+            with os.scandir(nfs_mount_point) as it:
+                entries = sorted((e for e in it
+                                  if e.is_file() and e.name.endswith(IMAGE_EXTS)),
+                                 key=lambda e: e.name)
+            files = [e.name for e in entries]
             if not files:
                 show_message_box(stdscr, "No Images", [
                     "No image files found on NFS share."
                 ], app_h)
-                subprocess.run(f"sudo umount {nfs_mount_point}", 
-                             shell=True, capture_output=True)
                 return
             
             app_h = draw_main_layout(stdscr, "Select Image", log_pad, log_win_height)
-            file_idx = get_menu_choice(stdscr, "Select Image File", sorted(files), app_h)
+            file_idx = get_menu_choice(stdscr, "Select Image File", files, app_h)
             if file_idx == -1:
-                subprocess.run(f"sudo umount {nfs_mount_point}", 
-                             shell=True, capture_output=True)
                 return
             
-            image_file = sorted(files)[file_idx]
-            image_path = os.path.join(nfs_mount_point, image_file)
-            is_compressed = image_file.endswith('.gz')
+            image_entry = entries[file_idx]
+            image_file = image_entry.name
+            image_path = image_entry.path
+            image_path_q = shlex.quote(image_path)
+            decompress_cmd = get_decompression_cmd(image_file)
+            is_compressed = decompress_cmd is not None
             
-            if is_compressed:
-                total_size = get_uncompressed_size(image_path)
-                full_cmd = (f"gunzip -c {image_path} | "
-                           f"sudo dd of={target_device['name']} {DD_OPTS} "
-                           f"status=progress")
+            if is_compressed and PV_AVAILABLE:
+                # Report progress on the compressed stream read by pv rather
+                # than reading the whole image over NFS to size it first
+                total_size = image_entry.stat().st_size
+                full_cmd = (f"pv -f -n -b -i 1 {image_path_q} | {decompress_cmd} | "
+                           f"sudo dd of={target_device['name']} {DD_NET_OPTS} "
+                           f"{dd_write_opts} status=none")
+            elif is_compressed:
+                if image_file.endswith('.gz'):
+                    # gzip only records the size modulo 4 GiB, so scale the bar
+                    # to the target device instead of trusting or probing it
+                    total_size = target_device['bytes']
+                else:
+                    # Sized in the background while the user confirms the restore
+                    size_future = _bg_executor.submit(get_uncompressed_size, image_path)
+                    total_size = 0
+                full_cmd = (f"{decompress_cmd} {image_path_q} | "
+                           f"sudo dd of={target_device['name']} {DD_NET_OPTS} "
+                           f"{dd_write_opts} status=progress")
             else:
-                total_size = os.path.getsize(image_path)
-                full_cmd = (f"sudo dd if={image_path} of={target_device['name']} "
-                           f"{DD_OPTS} status=progress")
+                # nocache makes dd drop the image pages as it streams them
+                total_size = image_entry.stat().st_size
+                full_cmd = (f"sudo dd if={image_path_q} of={target_device['name']} "
+                           f"{DD_NET_OPTS} iflag=nocache {dd_write_opts} status=progress")
             
             source_str = f"{nfs_path}/{image_file}"
             
         except Exception as e:
             show_message_box(stdscr, "Error", [f"Error accessing NFS: {e}"], app_h)
-            subprocess.run(f"sudo umount {nfs_mount_point}", 
-                         shell=True, capture_output=True)
             return
     
     # Confirmation
@@ -4021,17 +4958,14 @@ def network_restore_ssh_only(stdscr, log_pad, log_win_height, protocol):
             "ALL DATA on the target device will be PERMANENTLY ERASED.",
             "This operation cannot be undone."
         ], app_h):
+            if size_future is not None:
+                # Streamed zstd/xz images record no content size; scale to the device
+                total_size = size_future.result() or target_device['bytes']
             run_dd_with_progress(stdscr, full_cmd, total_size,
                                source_str, target_device['name'], app_h)
-            
-            # Cleanup NFS mount if used
             if protocol == "nfs":
-                subprocess.run(f"sudo umount {nfs_mount_point}",
-                             shell=True, capture_output=True)
-                try:
-                    os.rmdir(nfs_mount_point)
-                except:
-                    pass
+                # The image is read once, don't let it push everything else out of the page cache
+                drop_file_cache(image_path)
 
 def network_backup_logic(stdscr, log_pad, log_win_height):
     """Backup disk to remote location via SSH or NFS."""
@@ -4049,7 +4983,7 @@ def network_backup_logic(stdscr, log_pad, log_win_height):
     
     # Select source device
     app_h = draw_main_layout(stdscr, "Network Backup", log_pad, log_win_height)
-    devices = get_devices()
+    devices = get_cached_devices()
     if not devices:
         log.error("No block devices found for backup.")
         show_message_box(stdscr, "Error", ["No block devices found."], app_h)
@@ -4062,9 +4996,14 @@ def network_backup_logic(stdscr, log_pad, log_win_height):
         return
     source_device = devices[choice_idx]
     
+    # Start the SMART probe now so it runs while the user answers the prompts below
+    smart_future = _bg_executor.submit(check_smart_status, source_device['name'])
+    
     # Check if device is mounted
     is_mounted, mount_point = is_device_mounted(source_device['name'])
     if is_mounted:
+        # Trim while the filesystems are still mounted so unused blocks compress away
+        offer_source_trim(stdscr, source_device['name'], log_pad, log_win_height)
         app_h = draw_main_layout(stdscr, "Device Mounted", log_pad, log_win_height)
         if show_confirmation(stdscr, "Device Mounted", [
             f"Device {source_device['name']} is mounted at {mount_point}.",
@@ -4105,7 +5044,7 @@ def network_backup_logic(stdscr, log_pad, log_win_height):
     
     # Check SMART status
     # Check SMART status
-    smart_ok, smart_info = check_smart_status(source_device['name'])
+    smart_ok, smart_info = smart_future.result()
     app_h = draw_main_layout(stdscr, "SMART Check", log_pad, log_win_height)
     if not show_smart_results(stdscr, source_device['name'], smart_ok, smart_info, app_h):
         log.info("Checksum cancelled - user declined after SMART check.")
@@ -4118,12 +5057,18 @@ def network_backup_logic(stdscr, log_pad, log_win_height):
         if not ssh_host:
             log.info("Network backup cancelled.")
             return
+        if not is_valid_ssh_name(ssh_host):
+            show_message_box(stdscr, "Invalid Host", [f"Not a valid hostname or IP address: {ssh_host}"], app_h)
+            return
         
         app_h = draw_main_layout(stdscr, "SSH Details", log_pad, log_win_height)
         ssh_user = get_input_string(stdscr, "Enter SSH username", app_h)
         if not ssh_user:
             log.info("Network backup cancelled.")
             return
+        if not is_valid_ssh_name(ssh_user):
+            show_message_box(stdscr, "Invalid Username", [f"Not a valid username: {ssh_user}"], app_h)
+            return
         
         # Test SSH connection first (moved up for browsing)
         app_h = draw_main_layout(stdscr, "Testing Connection", log_pad, log_win_height)
@@ -4165,6 +5110,15 @@ def network_backup_logic(stdscr, log_pad, log_win_height):
             return
         
         compression_ext, compression_cmd, compression_desc = compression_choice
+        compression_cmd = get_parallel_compression_cmd(compression_cmd)
+        
+        # Fail fast if the remote side cannot hold the image
+        required_space = estimate_backup_size(source_device['bytes'], bool(compression_cmd))
+        space_check = check_ssh_free_space(ssh_user, ssh_host, remote_dir, required_space)
+        if not confirm_backup_space(stdscr, space_check, bool(compression_cmd),
+                                    log_pad, log_win_height):
+            log.info("Network backup cancelled - insufficient remote space.")
+            return
         
         # Generate default filename with timestamp
         extension = ".img" + (compression_ext if compression_ext else "")
@@ -4175,20 +5129,31 @@ def network_backup_logic(stdscr, log_pad, log_win_height):
         stdscr.refresh()
         app_h = draw_main_layout(stdscr, "Filename", log_pad, log_win_height)
         final_filename = get_input_string(stdscr, "Enter backup filename", app_h, default_filename)
-        if not final_filename:
-            final_filename = default_filename
+        final_filename = backup_file_name(final_filename, default_filename)
         
-        remote_path = f"{remote_dir}/{final_filename}"
+        # PurePosixPath also drops a trailing slash from the entered directory
+        remote_path = str(PurePosixPath(remote_dir) / final_filename)
         
         # Build SSH command
-        if compression_cmd:
-            full_cmd = (f"sudo dd if={source_device['name']} {DD_OPTS} "
-                       f"status=progress | {compression_cmd} | "
-                       f"ssh {ssh_user}@{ssh_host} 'cat > {remote_path}'")
+        streams = ssh_stream_count(source_device['name']) if compression_cmd is None else 1
+        if streams > 1:
+            # Raw images from SSDs are split across parallel SSH connections
+            full_cmd = (f"{SELF_CMD} --ssh-stripe backup {shlex.quote(ssh_user)} {shlex.quote(ssh_host)} "
+                       f"{shlex.quote(remote_path)} {source_device['name']} "
+                       f"{source_device['bytes']} {streams}")
         else:
-            full_cmd = (f"sudo dd if={source_device['name']} {DD_OPTS} "
-                       f"status=progress | "
-                       f"ssh {ssh_user}@{ssh_host} 'cat > {remote_path}'")
+            if compression_cmd is None and SPLICE_COPY_CMD:
+                # Uncompressed streams go from the device into the pipe with splice(2),
+                # skipping dd's copy through user space
+                cmd_parts = [f"{SPLICE_COPY_CMD} {source_device['name']}"]
+            else:
+                cmd_parts = [f"sudo dd if={source_device['name']} {DD_NET_OPTS} "
+                             f"{DD_NET_SOURCE_OPTS} status=progress"]
+            if compression_cmd:
+                cmd_parts.append(f"{MBUFFER_STAGE}{compression_cmd}")
+            cmd_parts.append(f"{MBUFFER_STAGE}ssh {ssh_fast_opts()} {shlex.quote(ssh_user + '@' + ssh_host)} "
+                             f"{shlex.quote('cat > ' + quote_remote_path(remote_path))}")
+            full_cmd = " | ".join(cmd_parts)
         
         dest_str = f"{ssh_user}@{ssh_host}:{remote_path}"
         
@@ -4211,9 +5176,7 @@ def network_backup_logic(stdscr, log_pad, log_win_height):
         
         app_h = draw_main_layout(stdscr, "Network Backup", log_pad, log_win_height)
         # Mount NFS temporarily
-        os.makedirs(nfs_mount_point, exist_ok=True)
-        mount_cmd = f"sudo mount -t nfs {nfs_path} {nfs_mount_point}"
-        mount_result = subprocess.run(mount_cmd, shell=True, capture_output=True)
+        mount_result = mount_nfs(nfs_path, nfs_mount_point)
         
         if mount_result.returncode != 0:
             show_message_box(stdscr, "Mount Error", [
@@ -4228,6 +5191,15 @@ def network_backup_logic(stdscr, log_pad, log_win_height):
             return
         
         compression_ext, compression_cmd, compression_desc = compression_choice
+        compression_cmd = get_parallel_compression_cmd(compression_cmd)
+        
+        # Fail fast if the NFS export cannot hold the image
+        required_space = estimate_backup_size(source_device['bytes'], bool(compression_cmd))
+        space_check = check_free_space(nfs_mount_point, required_space)
+        if not confirm_backup_space(stdscr, space_check, bool(compression_cmd),
+                                    log_pad, log_win_height):
+            log.info("Network backup cancelled - insufficient NFS space.")
+            return
         
         # Generate default filename with timestamp
         extension = ".img" + (compression_ext if compression_ext else "")
@@ -4238,19 +5210,26 @@ def network_backup_logic(stdscr, log_pad, log_win_height):
         stdscr.refresh()
         app_h = draw_main_layout(stdscr, "Filename", log_pad, log_win_height)
         final_filename = get_input_string(stdscr, "Enter backup filename", app_h, default_filename)
-        if not final_filename:
-            final_filename = default_filename
+        final_filename = backup_file_name(final_filename, default_filename)
         
         final_path = os.path.join(nfs_mount_point, final_filename)
+        final_path_q = shlex.quote(final_path)
         
         if compression_cmd:
-            full_cmd = (f"sudo dd if={source_device['name']} {DD_OPTS} "
-                       f"status=progress | {compression_cmd} > {final_path}")
+            full_cmd = " | ".join([
+                f"sudo dd if={source_device['name']} {DD_NET_OPTS} "
+                f"{DD_NET_SOURCE_OPTS} status=progress",
+                f"{compression_cmd} > {final_path_q}"
+            ])
         else:
-            full_cmd = (f"sudo dd if={source_device['name']} {DD_OPTS} "
-                       f"of={final_path} status=progress")
+            # Reserve the whole image up front so the server allocates it in one
+            # request; dd then overwrites it in place (fallocate may be unsupported)
+            full_cmd = (f": > {final_path_q}; "
+                       f"fallocate -l {source_device['bytes']} {final_path_q} 2>/dev/null; "
+                       f"sudo dd if={source_device['name']} {DD_NET_OPTS} {DD_NET_SOURCE_OPTS} "
+                       f"of={final_path_q} conv=notrunc,fsync status=progress")
         
-        dest_str = f"{nfs_path}/{final_filename}"
+        dest_str = f"{nfs_path.rstrip('/')}/{final_filename}"
     
     # Confirmation
     app_h = draw_main_layout(stdscr, "Network Backup Confirmation", 
@@ -4269,15 +5248,6 @@ def network_backup_logic(stdscr, log_pad, log_win_height):
         ], app_h):
             run_dd_with_progress(stdscr, full_cmd, source_device['bytes'],
                                source_device['name'], dest_str, app_h)
-            
-            # Cleanup NFS mount if used
-            if protocol == "nfs":
-                subprocess.run(f"sudo umount {nfs_mount_point}", 
-                             shell=True, capture_output=True)
-                try:
-                    os.rmdir(nfs_mount_point)
-                except:
-                    pass
 
 def network_restore_logic(stdscr, log_pad, log_win_height):
     """Restore disk from remote location via SSH or NFS."""
@@ -4296,7 +5266,7 @@ def network_restore_logic(stdscr, log_pad, log_win_height):
     
     # Select target device
     app_h = draw_main_layout(stdscr, "Network Restore", log_pad, log_win_height)
-    devices = get_devices()
+    devices = get_cached_devices()
     if not devices:
         log.error("No block devices found for restore.")
         show_message_box(stdscr, "Error", ["No block devices found."], app_h)
@@ -4311,6 +5281,9 @@ def network_restore_logic(stdscr, log_pad, log_win_height):
         return
     target_device = devices[choice_idx]
     
+    # Start the SMART probe now so it runs while the user answers the prompts below
+    smart_future = _bg_executor.submit(check_smart_status, target_device['name'])
+    
     # Check if device is mounted
     is_mounted, mount_point = is_device_mounted(target_device['name'])
     if is_mounted:
@@ -4354,12 +5327,24 @@ def network_restore_logic(stdscr, log_pad, log_win_height):
     
     # Check SMART status
     # Check SMART status
-    smart_ok, smart_info = check_smart_status(target_device['name'])
+    smart_ok, smart_info = smart_future.result()
     app_h = draw_main_layout(stdscr, "SMART Check", log_pad, log_win_height)
     if not show_smart_results(stdscr, target_device['name'], smart_ok, smart_info, app_h):
         log.info("Wipe cancelled - user declined after SMART check.")
         return
     
+    # Skipping zero blocks is much faster for mostly empty images but leaves the
+    # target's old contents in those ranges, so it is opt-in
+    app_h = draw_main_layout(stdscr, "Network Restore", log_pad, log_win_height)
+    sparse_restore = show_confirmation(stdscr, "Sparse Restore", [
+        "Skip writing all-zero blocks to the target?",
+        "Faster for mostly empty images, but old data on the",
+        "target is kept wherever the image is zero.",
+        "(No = exact block-for-block copy)"
+    ], app_h)
+    dd_write_opts = f"{DD_NET_DEVICE_OPTS} conv=sparse" if sparse_restore else DD_NET_DEVICE_OPTS
+    size_future = None
+    
     if protocol == "ssh":
         # Get SSH connection details
         app_h = draw_main_layout(stdscr, "SSH Details", log_pad, log_win_height)
@@ -4367,12 +5352,18 @@ def network_restore_logic(stdscr, log_pad, log_win_height):
         if not ssh_host:
             log.info("Network restore cancelled.")
             return
+        if not is_valid_ssh_name(ssh_host):
+            show_message_box(stdscr, "Invalid Host", [f"Not a valid hostname or IP address: {ssh_host}"], app_h)
+            return
         
         app_h = draw_main_layout(stdscr, "SSH Details", log_pad, log_win_height)
         ssh_user = get_input_string(stdscr, "Enter SSH username", app_h)
         if not ssh_user:
             log.info("Network restore cancelled.")
             return
+        if not is_valid_ssh_name(ssh_user):
+            show_message_box(stdscr, "Invalid Username", [f"Not a valid username: {ssh_user}"], app_h)
+            return
         
         app_h = draw_main_layout(stdscr, "SSH Details", log_pad, log_win_height)
         # Test SSH connection first (needed for browsing)
@@ -4393,10 +5384,10 @@ def network_restore_logic(stdscr, log_pad, log_win_height):
         ], app_h)
         
         if browse_choice:
-            # Browse remote files (filter for .img and .img.gz)
+            # Browse remote files (filter for image extensions)
             remote_file = ssh_browse_directory(stdscr, ssh_user, ssh_host,
                                               "/home", log_pad, log_win_height,
-                                              file_filter=['.img', '.img.gz'])
+                                              file_filter=list(IMAGE_EXTS))
             if not remote_file:
                 log.info("Network restore cancelled - no file selected.")
                 return
@@ -4408,27 +5399,49 @@ def network_restore_logic(stdscr, log_pad, log_win_height):
                 return
         
         # Auto-detect compression from filename
-        is_compressed = remote_file.endswith('.gz')
-        
-        # Allow user to override if not compressed
-        app_h = draw_main_layout(stdscr, "Network Restore", log_pad, log_win_height)
-        if not is_compressed:
-            is_compressed = show_confirmation(stdscr, "Compression",
-                                            ["Is the remote file gzip compressed?"], app_h)
+        decompress_cmd = get_decompression_cmd(remote_file)
+        
+        # Ask for the format when the filename does not tell us
+        if not decompress_cmd:
+            app_h = draw_main_layout(stdscr, "Network Restore", log_pad, log_win_height)
+            format_idx = get_menu_choice(stdscr, "Remote Image Compression", [
+                "None - Raw image",
+                "zstd (.zst)",
+                "gzip (.gz)",
+                "xz (.xz)"
+            ], app_h)
+            if format_idx == -1:
+                log.info("Network restore cancelled.")
+                return
+            decompress_cmd = get_decompression_cmd(("", ".zst", ".gz", ".xz")[format_idx])
+        is_compressed = decompress_cmd is not None
         
         # Build SSH command
         if is_compressed:
-            full_cmd = (f"ssh {ssh_user}@{ssh_host} 'cat {remote_file}' | "
-                       f"gunzip -c | sudo dd of={target_device['name']} "
-                       f"{DD_OPTS} status=progress")
+            full_cmd = (f"ssh {ssh_fast_opts()} {shlex.quote(ssh_user + '@' + ssh_host)} {shlex.quote('cat ' + quote_remote_path(remote_file))} | "
+                       f"{MBUFFER_STAGE}{decompress_cmd} | "
+                       f"{MBUFFER_STAGE}sudo dd of={target_device['name']} {DD_NET_OPTS} "
+                       f"{dd_write_opts} status=progress")
         else:
-            full_cmd = (f"ssh {ssh_user}@{ssh_host} 'cat {remote_file}' | "
-                       f"sudo dd of={target_device['name']} {DD_OPTS} "
-                       f"status=progress")
+            full_cmd = (f"ssh {ssh_fast_opts()} {shlex.quote(ssh_user + '@' + ssh_host)} {shlex.quote('cat ' + quote_remote_path(remote_file))} | "
+                       f"{MBUFFER_STAGE}sudo dd of={target_device['name']} {DD_NET_OPTS} "
+                       f"{dd_write_opts} status=progress")
         
         source_str = f"{ssh_user}@{ssh_host}:{remote_file}"
         total_size = target_device['bytes']  # Estimate
         
+        # Raw images of known size are split across parallel SSH connections
+        # when the target is an SSD (sparse restores keep dd, which does the
+        # zero-block skipping)
+        streams = ssh_stream_count(target_device['name'])
+        if not is_compressed and not sparse_restore and streams > 1:
+            remote_size = get_ssh_file_size(ssh_user, ssh_host, remote_file)
+            if remote_size:
+                total_size = remote_size
+                full_cmd = (f"{SELF_CMD} --ssh-stripe restore {shlex.quote(ssh_user)} {shlex.quote(ssh_host)} "
+                           f"{shlex.quote(remote_file)} {target_device['name']} "
+                           f"{remote_size} {streams}")
+        
     else:  # NFS
         app_h = draw_main_layout(stdscr, "NFS Details", log_pad, log_win_height)
         nfs_path = get_input_string(stdscr, "Enter NFS path (server:/path)", app_h)
@@ -4446,10 +5459,17 @@ def network_restore_logic(stdscr, log_pad, log_win_height):
             ], app_h)
             return
         
-        # Mount NFS temporarily
-        os.makedirs(nfs_mount_point, exist_ok=True)
-        mount_cmd = f"sudo mount -t nfs {nfs_path} {nfs_mount_point}"
-        mount_result = subprocess.run(mount_cmd, shell=True, capture_output=True)
+        # Without cachefilesd the 'fsc' option is accepted but caches nothing
+        if not check_fscache() and not _fscache_state['notified']:
+            _fscache_state['notified'] = True
+            show_message_box(stdscr, "FS-Cache Inactive", [
+                "cachefilesd is not installed or not running.",
+                "Repeat restores of the same image will be read",
+                "from the NFS server again instead of a local cache."
+            ], app_h)
+        
+        # Mount NFS temporarily (fsc lets repeat restores read from local cache)
+        mount_result = mount_nfs(nfs_path, nfs_mount_point, extra_opts="fsc")
         
         if mount_result.returncode != 0:
             show_message_box(stdscr, "Mount Error", [
@@ -4459,43 +5479,59 @@ def network_restore_logic(stdscr, log_pad, log_win_height):
         
         # List available image files
         try:
-            files = [f for f in os.listdir(nfs_mount_point) 
-                    if f.endswith('.img') or f.endswith('.img.gz')]
+            # is_file() uses the d_type from readdir, so only the chosen image is stat'ed
+            with os.scandir(nfs_mount_point) as it:
+                entries = sorted((e for e in it
+                                  if e.is_file() and e.name.endswith(IMAGE_EXTS)),
+                                 key=lambda e: e.name)
+            files = [e.name for e in entries]
             if not files:
                 show_message_box(stdscr, "No Images", [
                     "No image files found on NFS share."
                 ], app_h)
-                subprocess.run(f"sudo umount {nfs_mount_point}", 
-                             shell=True, capture_output=True)
                 return
             
             app_h = draw_main_layout(stdscr, "Select Image", log_pad, log_win_height)
-            file_idx = get_menu_choice(stdscr, "Select Image File", sorted(files), app_h)
+            file_idx = get_menu_choice(stdscr, "Select Image File", files, app_h)
             if file_idx == -1:
-                subprocess.run(f"sudo umount {nfs_mount_point}", 
-                             shell=True, capture_output=True)
                 return
             
-            image_file = sorted(files)[file_idx]
-            image_path = os.path.join(nfs_mount_point, image_file)
-            is_compressed = image_file.endswith('.gz')
+            image_entry = entries[file_idx]
+            image_file = image_entry.name
+            image_path = image_entry.path
+            image_path_q = shlex.quote(image_path)
+            decompress_cmd = get_decompression_cmd(image_file)
+            is_compressed = decompress_cmd is not None
             
-            if is_compressed:
-                total_size = get_uncompressed_size(image_path)
-                full_cmd = (f"gunzip -c {image_path} | "
-                           f"sudo dd of={target_device['name']} {DD_OPTS} "
-                           f"status=progress")
+            if is_compressed and PV_AVAILABLE:
+                # Report progress on the compressed stream read by pv rather
+                # than reading the whole image over NFS to size it first
+                total_size = image_entry.stat().st_size
+                full_cmd = (f"pv -f -n -b -i 1 {image_path_q} | {decompress_cmd} | "
+                           f"sudo dd of={target_device['name']} {DD_NET_OPTS} "
+                           f"{dd_write_opts} status=none")
+            elif is_compressed:
+                if image_file.endswith('.gz'):
+                    # gzip only records the size modulo 4 GiB, so scale the bar
+                    # to the target device instead of trusting or probing it
+                    total_size = target_device['bytes']
+                else:
+                    # Sized in the background while the user confirms the restore
+                    size_future = _bg_executor.submit(get_uncompressed_size, image_path)
+                    total_size = 0
+                full_cmd = (f"{decompress_cmd} {image_path_q} | "
+                           f"sudo dd of={target_device['name']} {DD_NET_OPTS} "
+                           f"{dd_write_opts} status=progress")
             else:
-                total_size = os.path.getsize(image_path)
-                full_cmd = (f"sudo dd if={image_path} of={target_device['name']} "
-                           f"{DD_OPTS} status=progress")
+                # nocache makes dd drop the image pages as it streams them
+                total_size = image_entry.stat().st_size
+                full_cmd = (f"sudo dd if={image_path_q} of={target_device['name']} "
+                           f"{DD_NET_OPTS} iflag=nocache {dd_write_opts} status=progress")
             
             source_str = f"{nfs_path}/{image_file}"
             
         except Exception as e:
             show_message_box(stdscr, "Error", [f"Error accessing NFS: {e}"], app_h)
-            subprocess.run(f"sudo umount {nfs_mount_point}", 
-                         shell=True, capture_output=True)
             return
     
     # Confirmation
@@ -4513,24 +5549,21 @@ def network_restore_logic(stdscr, log_pad, log_win_height):
             "ALL DATA on the target device will be PERMANENTLY ERASED.",
             "This operation cannot be undone."
         ], app_h):
+            if size_future is not None:
+                # Streamed zstd/xz images record no content size; scale to the device
+                total_size = size_future.result() or target_device['bytes']
             run_dd_with_progress(stdscr, full_cmd, total_size,
                                source_str, target_device['name'], app_h)
-            
-            # Cleanup NFS mount if used
             if protocol == "nfs":
-                subprocess.run(f"sudo umount {nfs_mount_point}",
-                             shell=True, capture_output=True)
-                try:
-                    os.rmdir(nfs_mount_point)
-                except:
-                    pass
+                # The image is read once, don't let it push everything else out of the page cache
+                drop_file_cache(image_path)
 
 def wipe_disk_logic(stdscr, log_pad, log_win_height):
     """Secure disk wiping with various algorithms."""
     app_h = draw_main_layout(stdscr, "Secure Disk Wipe", log_pad, log_win_height)
     
     # Get list of devices
-    devices = get_devices()
+    devices = get_cached_devices()
     if not devices:
         show_message_box(stdscr, "No Devices", ["No devices found."], app_h)
         return
@@ -4623,13 +5656,7 @@ def wipe_disk_logic(stdscr, log_pad, log_win_height):
     
     # Select wiping algorithm
     app_h = draw_main_layout(stdscr, "Select Wipe Method", log_pad, log_win_height)
-    wipe_methods = [
-        "Zero Fill (1 pass) - Fast, good for non-sensitive data",
-        "Random Data (1 pass) - Fast, better security than zeros",
-        "DoD 5220.22-M (3 passes) - US DoD standard",
-        "Random Data (7 passes) - High security, slower",
-        "Gutmann (35 passes) - Maximum security, very slow"
-    ]
+    wipe_methods = [label for label, _, _ in WIPE_METHODS]
     
     method_idx = get_menu_choice(stdscr, "Select Wipe Algorithm", wipe_methods, app_h)
     if method_idx == -1:
@@ -4638,35 +5665,8 @@ def wipe_disk_logic(stdscr, log_pad, log_win_height):
     
     log.info(f"User selected wipe method index {method_idx}")
     
-    # Configure wipe parameters based on method
-    method_name = ""
-    passes = []
-    
-    if method_idx == 0:
-        method_name = "Zero Fill"
-        passes = [("zero", "0x00")]
-    elif method_idx == 1:
-        method_name = "Random Data (1 pass)"
-        passes = [("random", "/dev/urandom")]
-    elif method_idx == 2:
-        method_name = "DoD 5220.22-M"
-        passes = [("random", "/dev/urandom"), ("complement", "0xFF"), ("random", "/dev/urandom")]
-    elif method_idx == 3:
-        method_name = "Random Data (7 passes)"
-        passes = [("random", "/dev/urandom")] * 7
-    elif method_idx == 4:
-        method_name = "Gutmann (35 passes)"
-        # Simplified Gutmann - alternating random and patterns
-        passes = [("random", "/dev/urandom")] * 4
-        patterns = ["0x55", "0xAA", "0x92", "0x49", "0x24", "0x00", "0x11", "0x22", "0x33",
-                   "0x44", "0x55", "0x66", "0x77", "0x88", "0x99", "0xAA", "0xBB", "0xCC",
-                   "0xDD", "0xEE", "0xFF", "0x92", "0x49", "0x24", "0x6D", "0xB6", "0xDB"]
-        for pattern in patterns:
-            passes.append(("pattern", pattern))
-        passes.extend([("random", "/dev/urandom")] * 4)
-    else:
-        log.error("Invalid wipe method selection")
-        return
+    # Look up wipe parameters for the chosen method
+    _, method_name, passes = WIPE_METHODS[method_idx]
     
     # Final confirmation with strong warning
     app_h = draw_main_layout(stdscr, "FINAL WARNING", log_pad, log_win_height)
@@ -4690,20 +5690,62 @@ def wipe_disk_logic(stdscr, log_pad, log_win_height):
     log.info(f"Block size: {block_size}")
     log.info(f"Total passes: {len(passes)}")
     
+    # fsync ends each pass on the media; with buffered writes the next pass
+    # could otherwise overwrite this one's pages before they are written back
+    dd_out = f"of={shlex.quote(device_path)} bs={block_size} {DD_DEVICE_WRITE_OPTS} conv=sync,noerror,fsync status=progress"
+    
     for pass_num, (pass_type, pass_value) in enumerate(passes, 1):
         log.info(f"Pass {pass_num}/{len(passes)}: {pass_type} with {pass_value}")
         
         wipe_cmd = ""
+        if pass_type == "zeroout":
+            # Have the device zero itself (write-zeroes offload on SSD/NVMe). Unlike a
+            # plain discard, the blocks are guaranteed to read back as zeros
+            zeroed = False
+            try:
+                proc = subprocess.Popen(["blkdiscard", "-f", "-z", device_path],
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+            except OSError as e:
+                log.warning(f"blkdiscard unavailable, falling back to zero fill: {e}")
+            else:
+                started = time.monotonic()
+                app_h = draw_main_layout(stdscr, "Wiping Disk", log_pad, log_win_height)
+                wait_win = show_wait_overlay(stdscr, app_h, f"Zeroing {device_path}...", "Elapsed: 00:00:00")
+                while True:
+                    try:
+                        proc.wait(timeout=1)
+                        break
+                    except subprocess.TimeoutExpired:
+                        pass
+                    try:
+                        wait_win.addstr(3, 3, f"Elapsed: {format_time(time.monotonic() - started)}")
+                    except curses.error:
+                        pass
+                    wait_win.noutrefresh()
+                    curses.doupdate()
+                del wait_win
+                _, err = proc.communicate()
+                zeroed = proc.returncode == 0
+                if not zeroed:
+                    log.warning(f"blkdiscard -z failed, falling back to zero fill: {err.strip()}")
+            if zeroed:
+                log.info(f"Zeroed all blocks on {device_path}")
+                continue
+            pass_type = "zero"
+        
         if pass_type == "zero":
             # Zero fill using dd with error handling
-            wipe_cmd = f"dd if=/dev/zero of=\"{device_path}\" bs={block_size} conv=sync,noerror status=progress"
+            wipe_cmd = f"dd if=/dev/zero {dd_out}"
         elif pass_type == "random":
             # Random data using dd with error handling
-            wipe_cmd = f"dd if={pass_value} of=\"{device_path}\" bs={block_size} conv=sync,noerror status=progress"
+            random_cmd = get_random_stream_cmd()
+            if random_cmd:
+                wipe_cmd = f"{random_cmd} | dd iflag=fullblock {dd_out}"
+            else:
+                wipe_cmd = f"dd if={pass_value} {dd_out}"
         elif pass_type in ["pattern", "complement"]:
-            # Pattern fill using tr and dd with error handling
-            # Convert hex pattern to octal for tr
-            wipe_cmd = f"tr '\\000' '{pass_value}' < /dev/zero | dd of=\"{device_path}\" bs={block_size} conv=sync,noerror status=progress"
+            # Pattern fill from a precomputed buffer; fullblock keeps dd's writes whole
+            wipe_cmd = f"{SELF_CMD} --fill-pattern {pass_value} | dd iflag=fullblock {dd_out}"
         
         if not wipe_cmd:
             log.error(f"Invalid pass type: {pass_type}")
@@ -4715,7 +5757,7 @@ def wipe_disk_logic(stdscr, log_pad, log_win_height):
         if pass_type == "zero":
             source_display = "/dev/zero"
         elif pass_type == "random":
-            source_display = pass_value
+            source_display = "openssl keystream" if random_cmd else pass_value
         else:
             source_display = f"Pattern {pass_value}"
         
@@ -4762,6 +5804,27 @@ def check_disk_logic(stdscr, log_pad, log_win_height):
     # Display interactive smartctl output viewer (will handle fetching data)
     show_smartctl_output(stdscr, device_path, selected_device, app_h, log_pad, log_win_height)
 
+@functools.lru_cache(maxsize=4096)
+def smart_line_attr(text):
+    """Curses attribute for one line of the SMART viewer.
+    
+    smartctl -a and -x output share most of their lines, so the cache
+    carries over between toggles and refreshes.
+    """
+    # Add some basic formatting for headers and important lines
+    lower = text.lower()
+    if "===" in text:
+        return curses.A_BOLD
+    elif text.startswith(("Device:", "Size:", "Model:")):
+        return curses.color_pair(6) | curses.A_BOLD
+    elif "SMART" in text and ":" in text:
+        return curses.color_pair(5)
+    elif "test" in lower and "pass" in lower:
+        return curses.color_pair(7)
+    elif "test" in lower and "fail" in lower:
+        return curses.color_pair(4)
+    return curses.A_NORMAL
+
 def show_smartctl_output(stdscr, device_path, device_info, app_h, log_pad, log_win_height):
     """Display smartctl output in a scrollable window with toggle between -a and -x."""
     h, w = stdscr.getmaxyx()
@@ -4822,12 +5885,42 @@ def show_smartctl_output(stdscr, device_path, device_info, app_h, log_pad, log_w
         # Add instruction at the bottom
         formatted.append("")
         formatted.append("=" * 60)
-        formatted.append("Use ↑↓/PgUp/PgDn to scroll | 't' to toggle -a/-x | Esc/q to return")
+        formatted.append("Use ↑↓/PgUp/PgDn to scroll | 't' to toggle -a/-x | 'r' to refresh | Esc/q to return")
         
         return formatted
     
-    # Initial data fetch
-    data, error = fetch_smartctl_data("-a")
+    def build_display_cache(lines):
+        """Pre-truncate lines and pick their display attribute once."""
+        cache = []
+        for line in lines:
+            if len(line) > content_width - 4:
+                text = line[:content_width - 7] + "..."
+            else:
+                text = line
+            cache.append((smart_line_attr(text), text))
+        return cache
+    
+    # Key groups tested on every keypress, built once
+    quit_keys = frozenset((27, ord('q'), ord('Q')))
+    toggle_keys = frozenset((ord('t'), ord('T')))
+    refresh_keys = frozenset((ord('r'), ord('R')))
+    
+    # Initial data fetch runs in the background so Esc/q can abort a slow drive
+    pending = _bg_executor.submit(fetch_smartctl_data, "-a")
+    wait_win = show_wait_overlay(stdscr, app_h, f"Reading SMART data from {device_path}...", "Esc/q to cancel")
+    
+    stdscr.timeout(100)
+    while not pending.done():
+        if stdscr.getch() in quit_keys:
+            stdscr.timeout(-1)
+            del wait_win
+            stdscr.noutrefresh()  # Written by the caller's next doupdate()
+            return
+    stdscr.timeout(-1)
+    del wait_win
+    
+    data, error = pending.result()
+    pending = None
     if error:
         show_message_box(stdscr, "Error", [
             f"Failed to read SMART data from {device_path}",
@@ -4840,80 +5933,105 @@ def show_smartctl_output(stdscr, device_path, device_info, app_h, log_pad, log_w
     
     # Create scrollable window
     content_height = min(len(formatted_lines) + 4, app_h - 4)
+    visible_lines = content_height - 4  # Fixed for the life of the viewer
     content_width = min(w - 4, 100)
     start_y = max(2, (app_h - content_height) // 2)
     start_x = max(1, (w - content_width) // 2)
     
-    win = draw_bordered_window(stdscr, start_y, start_x, content_height, content_width, "SMART Disk Information [t=toggle]")
+    win = draw_bordered_window(stdscr, start_y, start_x, content_height, content_width, "SMART Disk Information [t=toggle r=refresh]")
+    win.leaveok(True)  # Cursor is hidden, don't spend bytes repositioning it
     
     # Scrolling variables
     scroll_pos = 0
-    visible_lines = content_height - 4
     max_scroll = max(0, len(formatted_lines) - visible_lines)
+    display_cache = build_display_cache(formatted_lines)
+    # Loading message position and style, fixed for the life of the viewer
+    loading_msg = "Loading SMART data..."
+    loading_overlay = (content_height // 2, (content_width - len(loading_msg)) // 2,
+                       loading_msg, curses.A_BOLD | curses.color_pair(6))
+    # Formatted output per smartctl flag, so toggling back doesn't rerun smartctl
+    smart_cache = {"-a": (formatted_lines, display_cache)}
     loading = False
+    dirty = True
     
     while True:
-        # Clear content area
-        for i in range(2, content_height - 2):
-            win.move(i, 1)
-            win.clrtoeol()
-        
-        # Show loading message if fetching data
-        if loading:
-            loading_msg = "Loading SMART data..."
-            try:
-                win.addstr(content_height // 2, (content_width - len(loading_msg)) // 2, 
-                          loading_msg, curses.A_BOLD | curses.color_pair(6))
-            except:
-                pass
-        else:
-            # Display visible portion of content
-            for i, line_idx in enumerate(range(scroll_pos, min(scroll_pos + visible_lines, len(formatted_lines)))):
-                if i + 2 >= content_height - 2:
-                    break
+        # Pick up a finished background fetch
+        if pending is not None and pending.done():
+            data, error = pending.result()
+            pending = None
+            loading = False
+            if error:
+                # Show error but keep old data
+                stdscr.timeout(-1)
+                show_message_box(stdscr, "Error", [
+                    f"Failed to fetch SMART data with {pending_flag}",
+                    "",
+                    error,
+                    "",
+                    "Press any key to continue with previous data"
+                ], app_h)
+            else:
+                # Update display with new data
+                use_extended = pending_flag == "-x"
+                formatted_lines = format_smartctl_lines(data, pending_flag)
+                display_cache = build_display_cache(formatted_lines)
+                smart_cache[pending_flag] = (formatted_lines, display_cache)
+                scroll_pos = 0  # Reset scroll to top
+                max_scroll = max(0, len(formatted_lines) - visible_lines)
+            
+            # Repaint only the viewer's rows over what the message box left behind
+            win.touchwin()
+            dirty = True
+        
+        if dirty:
+            dirty = False
+            # Clear content area
+            for i in range(2, content_height - 2):
+                win.move(i, 1)
+                win.clrtoeol()
+            
+            # Show loading message if fetching data
+            if loading:
                 try:
-                    display_line = formatted_lines[line_idx]
-                    if len(display_line) > content_width - 4:
-                        display_line = display_line[:content_width - 7] + "..."
-                    
-                    # Add some basic formatting for headers and important lines
-                    if "===" in display_line:
-                        win.addstr(i + 2, 2, display_line, curses.A_BOLD)
-                    elif display_line.startswith("Device:") or display_line.startswith("Size:") or display_line.startswith("Model:"):
-                        win.addstr(i + 2, 2, display_line, curses.color_pair(6) | curses.A_BOLD)
-                    elif "SMART" in display_line and ":" in display_line:
-                        win.addstr(i + 2, 2, display_line, curses.color_pair(5))
-                    elif "test" in display_line.lower() and ("pass" in display_line.lower() or "fail" in display_line.lower()):
-                        if "pass" in display_line.lower():
-                            win.addstr(i + 2, 2, display_line, curses.color_pair(7))
-                        else:
-                            win.addstr(i + 2, 2, display_line, curses.color_pair(4))
-                    else:
-                        win.addstr(i + 2, 2, display_line)
+                    win.addstr(*loading_overlay)
                 except:
-                    pass  # Skip lines that don't fit
-            
-            # Show scroll indicator and mode indicator
-            if max_scroll > 0:
-                scroll_info = f"[{scroll_pos + 1}-{min(scroll_pos + visible_lines, len(formatted_lines))} of {len(formatted_lines)}]"
+                    pass
+            else:
+                # Display visible portion of content
+                for i, (attr, text) in enumerate(display_cache[scroll_pos:scroll_pos + visible_lines]):
+                    try:
+                        win.addstr(i + 2, 2, text, attr)
+                    except:
+                        pass  # Skip lines that don't fit
+                
+                # Show scroll indicator and mode indicator
+                if max_scroll > 0:
+                    scroll_info = f"[{scroll_pos + 1}-{min(scroll_pos + visible_lines, len(formatted_lines))} of {len(formatted_lines)}]"
+                    try:
+                        win.addstr(content_height - 1, content_width - len(scroll_info) - 2, scroll_info, curses.color_pair(5))
+                    except:
+                        pass
+                
+                # Show current mode indicator
+                mode_indicator = f"[Mode: smartctl {'- x' if use_extended else '-a'}]"
                 try:
-                    win.addstr(content_height - 1, content_width - len(scroll_info) - 2, scroll_info, curses.color_pair(5))
+                    win.addstr(content_height - 1, 2, mode_indicator, curses.color_pair(3) | curses.A_BOLD)
                 except:
                     pass
             
-            # Show current mode indicator
-            mode_indicator = f"[Mode: smartctl {'- x' if use_extended else '-a'}]"
-            try:
-                win.addstr(content_height - 1, 2, mode_indicator, curses.color_pair(3) | curses.A_BOLD)
-            except:
-                pass
-        
-        # Keep log window visible
-        refresh_log_window(stdscr)
-        win.refresh()
+            
+            # Keep log window visible, then flush both in one update
+            refresh_log_window(stdscr, batch=True)
+            win.noutrefresh()
+            curses.doupdate()
         
-        # Handle input
+        # Handle input; block until a key arrives unless a fetch needs polling
+        stdscr.timeout(100 if pending is not None else -1)
         key = stdscr.getch()
+        if key == -1:
+            continue
+        
+        prev_scroll = scroll_pos
         
         if key == curses.KEY_UP and scroll_pos > 0:
             scroll_pos -= 1
@@ -4927,55 +6045,56 @@ def show_smartctl_output(stdscr, device_path, device_info, app_h, log_pad, log_w
             scroll_pos = 0
         elif key == curses.KEY_END:
             scroll_pos = max_scroll
-        elif key in [ord('t'), ord('T')]:  # Toggle between -a and -x
-            loading = True
-            win.refresh()  # Show loading message immediately
-            
-            # Toggle mode
-            use_extended = not use_extended
-            flag = "-x" if use_extended else "-a"
-            
-            # Fetch new data
-            data, error = fetch_smartctl_data(flag)
-            if error:
-                # Show error but keep old data
-                show_message_box(stdscr, "Error", [
-                    f"Failed to fetch SMART data with {flag}",
-                    "",
-                    error,
-                    "",
-                    "Press any key to continue with previous data"
-                ], app_h)
-                use_extended = not use_extended  # Revert toggle
-            else:
-                # Update display with new data
-                formatted_lines = format_smartctl_lines(data, flag)
+        elif key in toggle_keys:  # Toggle between -a and -x
+            flag = "-a" if use_extended else "-x"
+            if pending is None and flag in smart_cache:
+                # Viewed before, switch without running smartctl again
+                use_extended = not use_extended
+                formatted_lines, display_cache = smart_cache[flag]
                 scroll_pos = 0  # Reset scroll to top
-                visible_lines = content_height - 4
                 max_scroll = max(0, len(formatted_lines) - visible_lines)
-            
-            loading = False
-            # Redraw layout to clean up after message box
+                dirty = True
+            elif pending is None:
+                # Fetch the other mode in the background, keeping old data until it arrives
+                pending_flag = flag
+                pending = _bg_executor.submit(fetch_smartctl_data, pending_flag)
+                loading = True
+                dirty = True
+        elif key in refresh_keys:  # Re-read the current mode
+            if pending is None:
+                pending_flag = "-x" if use_extended else "-a"
+                pending = _bg_executor.submit(fetch_smartctl_data, pending_flag)
+                loading = True
+                dirty = True
+        elif key == curses.KEY_RESIZE:
+            # The viewer keeps its size, so the cached lines stay valid
             stdscr.touchwin()
-            stdscr.refresh()
             win.touchwin()
-        elif key in [27, ord('q'), ord('Q')]:  # Esc or q
+            dirty = True
+        elif key in quit_keys:  # Esc or q
             break
         # Handle mouse scroll
         elif key == curses.KEY_MOUSE:
             try:
-                _, mx, my, _, button_state = curses.getmouse()
-                if button_state & curses.BUTTON4_PRESSED:  # Scroll up
+                _, _, _, _, button_state = curses.getmouse()
+                if button_state & MOUSE_SCROLL_UP:
                     scroll_pos = max(0, scroll_pos - 3)
-                elif button_state & (1 << 21):  # Scroll down (BUTTON5_PRESSED)
+                elif button_state & MOUSE_SCROLL_DOWN:
                     scroll_pos = min(max_scroll, scroll_pos + 3)
-            except:
+            except curses.error:
                 pass
+        
+        if scroll_pos != prev_scroll:
+            dirty = True
     
-    # Clean up
+    # Clean up; the screen is staged only, the caller's next redraw writes it
+    # in the same doupdate() instead of painting the stale frame first
+    stdscr.timeout(-1)
     del win
-    stdscr.touchwin()
-    stdscr.refresh()
+    stdscr.noutrefresh()
+
+# Operation run for each MAIN_MENU entry before "Exit"
+MAIN_MENU_HANDLERS = (create_image_logic, restore_image_logic, wipe_disk_logic, check_disk_logic)
 
 def main(stdscr):
     """Main application loop."""
@@ -4995,51 +6114,45 @@ def main(stdscr):
     
     # Setup logging
     log_win_height = 8
-    log_pad = curses.newpad(1000, w) # Pad can hold 1000 lines
+    log_pad = curses.newpad(LOG_PAD_INITIAL_ROWS, w) # Grows up to LOG_PAD_MAX_ROWS lines
     curses_handler = setup_logging(log_pad, stdscr)
     curses_handler.set_log_height(log_win_height)
     log.info("Application started.")
+    check_fscache()
 
     should_exit = False
     try:
         while not should_exit:
+            # draw_main_layout stages the log pad in the same doupdate() as the screen,
+            # so nothing has been logged since that needs another pad refresh
             app_h = draw_main_layout(stdscr, "Main Menu", log_pad, log_win_height)
-            # Ensure log section is visible by refreshing it explicitly
-            h, w = stdscr.getmaxyx()
-            log_win_y = h - log_win_height
-            curses_handler = None
-            for handler in log.handlers:
-                if isinstance(handler, CursesHandler):
-                    curses_handler = handler
-                    break
-            if curses_handler and len(curses_handler.log_messages) > 0:
-                pad_start_line = max(0, len(curses_handler.log_messages) - (log_win_height - 2))
-                log_pad.refresh(pad_start_line, 0, log_win_y + 1, 2, h - 2, w - 3)
             
-            main_menu = [
-                "Backup Disk  - Create disk image to local file or network",
-                "Restore Disk - Restore disk image from local file or network",
-                "Wipe Disk    - Securely erase disk data",
-                "Check Disk   - Display disk health and information",
-                "Exit         - Close DDI application"
-            ]
-            choice = get_menu_choice(stdscr, "Main Menu - Select Operation", main_menu, app_h)
+            choice = get_menu_choice(stdscr, "Main Menu - Select Operation", MAIN_MENU, app_h)
             
-            if choice == 0: create_image_logic(stdscr, log_pad, log_win_height)
-            elif choice == 1: restore_image_logic(stdscr, log_pad, log_win_height)
-            elif choice == 2: wipe_disk_logic(stdscr, log_pad, log_win_height)
-            elif choice == 3: check_disk_logic(stdscr, log_pad, log_win_height)
-            elif choice == 4 or choice == -1:
+            if choice == len(MAIN_MENU) - 1 or choice == -1:
                 # Exit immediately without confirmation (good UX practice)
                 log.info("Application exiting.")
                 should_exit = True
+            elif 0 <= choice < len(MAIN_MENU_HANDLERS):
+                MAIN_MENU_HANDLERS[choice](stdscr, log_pad, log_win_height)
     except curses.error as e:
         # If a curses error happens, log it and exit gracefully.
         log.critical(f"A critical curses error occurred: {e}")
-        # The finally block in __main__ will handle cleanup.
+        # curses.wrapper restores the terminal on the way out.
 
 
 if __name__ == "__main__":
+    # Helper mode used as the first stage of uncompressed SSH backup pipelines
+    if len(sys.argv) == 3 and sys.argv[1] == "--splice-copy":
+        sys.exit(splice_to_stdout(sys.argv[2]))
+    # Helper mode feeding pattern wipe passes
+    if len(sys.argv) == 3 and sys.argv[1] == "--fill-pattern":
+        sys.exit(fill_pattern_to_stdout(sys.argv[2]))
+    # Helper mode for raw SSH transfers split across parallel connections
+    if len(sys.argv) == 9 and sys.argv[1] == "--ssh-stripe":
+        direction, ssh_user, ssh_host, remote_path, local_path = sys.argv[2:7]
+        sys.exit(ssh_stripe_copy(direction, ssh_user, ssh_host, remote_path, local_path,
+                                 int(sys.argv[7]), int(sys.argv[8])))
     check_root()
     try:
         curses.wrapper(main)
@@ -5048,8 +6161,4 @@ if __name__ == "__main__":
         print(f"❌ Curses error during setup: {e}")
     except KeyboardInterrupt:
         print("\n👋 Exiting.")
-    finally:
-        if curses.has_colors():
-            try: curses.endwin()
-            except curses.error: pass
 
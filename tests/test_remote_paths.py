@@ -0,0 +1,36 @@
+import os
+import subprocess
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import ddi
+
+
+def remote_expand(quoted, home="/home/backup"):
+    """Expand a quoted path the way the remote POSIX shell would."""
+    return subprocess.run(["sh", "-c", f"printf %s {quoted}"], env={"HOME": home},
+                          capture_output=True, text=True, check=True).stdout
+
+
+class QuoteRemotePathTest(unittest.TestCase):
+    def test_leading_tilde_expands_to_remote_home(self):
+        self.assertEqual(remote_expand(ddi.quote_remote_path("~/backups/sda.img.zst")),
+                         "/home/backup/backups/sda.img.zst")
+
+    def test_bare_tilde_is_the_remote_home(self):
+        self.assertEqual(remote_expand(ddi.quote_remote_path("~")), "/home/backup")
+
+    def test_rest_of_a_tilde_path_stays_quoted(self):
+        path = "~/my images/$(touch pwned);`id`.img"
+        self.assertEqual(remote_expand(ddi.quote_remote_path(path)),
+                         "/home/backup/my images/$(touch pwned);`id`.img")
+
+    def test_plain_paths_are_quoted_literally(self):
+        for path in ("/srv/images/a b.img", "relative/~x.img", "/tmp/~/x"):
+            self.assertEqual(remote_expand(ddi.quote_remote_path(path)), path)
+
+
+if __name__ == "__main__":
+    unittest.main()